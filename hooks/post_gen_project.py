@@ -1,21 +1,34 @@
 """
 Post-generation hook for Django project template.
 
-Performs automated setup tasks after the project is generated:
-- Removes unselected apps and Docker files
-- Initializes git repository
-- Sets up Python environment with uv
-- Creates .env file
-- Installs pre-commit hooks
-- Creates initial migrations
+Removes unselected apps, feature files and Docker files, then runs the setup
+steps below as a small dependency graph. Independent steps run concurrently,
+and each starts as soon as the steps it needs have finished:
+
+- git init                          -> pre-commit hook environments
+- git init, uv sync                 -> pre-commit git hook
+- .env from .env.example            -> makemigrations
+- uv --version -> uv python pin -> uv sync (dev and test extras) -> makemigrations
+- all of the above                  -> initial git commit
+
+A timing summary of every step is printed at the end.
+
+Set UV_OFFLINE=1 to generate without network access: uv then only uses its
+local cache, and pre-commit hook environments, which need to be downloaded,
+are installed on the first commit instead.
 
 Exit codes:
-    0: Post-generation setup completed successfully
+    0: Post-generation setup completed (failed steps are reported)
     1: Critical error occurred during setup
 """
+import os
 import shutil
 import subprocess
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 
@@ -32,6 +45,12 @@ USE_DOCKER: Final[str] = "{{ cookiecutter.use_docker }}"
 DATABASE: Final[str] = "{{ cookiecutter.database }}"
 PYTHON_VERSION: Final[str] = "{{ cookiecutter.python_version }}"
 INCLUDE_ACCOUNTS: Final[str] = "{{ cookiecutter.include_accounts_app }}"
+USE_HUEY: Final[str] = "{{ cookiecutter.use_huey }}"
+USE_REST_FRAMEWORK: Final[str] = "{{ cookiecutter.use_rest_framework }}"
+USE_WEBSOCKETS: Final[str] = "{{ cookiecutter.use_websockets }}"
+
+# Same convention as uv itself: only the local cache is used.
+OFFLINE: Final[bool] = os.environ.get("UV_OFFLINE", "").lower() in ("1", "true", "yes")
 
 
 def print_success(msg: str) -> None:
@@ -54,30 +73,127 @@ def print_error(msg: str) -> None:
     print(f"{RED}✗{RESET} {msg}")
 
 
-def run_command(cmd: str, error_msg: str = "Command failed") -> bool:
+def run_command(cmd: list[str]) -> None:
     """
-    Execute a shell command and handle errors.
+    Execute a command without a shell, capturing its output.
     
     Args:
-        cmd: Shell command to execute
-        error_msg: Error message to display if command fails
+        cmd: Program and arguments
         
-    Returns:
-        True if command succeeded, False otherwise
+    Raises:
+        subprocess.CalledProcessError: The command exited with an error
+        OSError: The program could not be started (e.g. it is not installed)
+    """
+    subprocess.run(cmd, check=True, capture_output=True, text=True)
+
+
+@dataclass
+class Step:
     """
+    A setup step: a command, or a function, and the steps it waits for.
+    
+    Attributes:
+        name: Label used in progress output and the timing summary
+        action: Command to run, or a function to call
+        requires: Steps that must have succeeded; otherwise this is skipped
+        after: Steps that must have finished, successfully or not
+        hint: Advice printed when the step fails
+    """
+
+    name: str
+    action: list[str] | Callable[[], None]
+    requires: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+    hint: str = ""
+
+
+@dataclass
+class StepResult:
+    """Outcome of a step: "ok", "failed" or "skipped"."""
+
+    status: str
+    seconds: float = 0.0
+    error: str = ""
+
+
+def run_step(step: Step) -> StepResult:
+    """Run one step in a worker thread and time it."""
+    start = time.perf_counter()
     try:
-        subprocess.run(
-            cmd,
-            shell=True,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        return True
+        if callable(step.action):
+            step.action()
+        else:
+            run_command(step.action)
     except subprocess.CalledProcessError as e:
-        print_error(f"{error_msg}: {e.stderr}")
-        return False
+        # Tools disagree on where errors go; keep the end of both streams.
+        output = "\n".join(filter(None, (e.stdout.strip(), e.stderr.strip())))
+        error = "\n".join(output.splitlines()[-10:]) or str(e)
+        return StepResult("failed", time.perf_counter() - start, error)
+    except OSError as e:
+        return StepResult("failed", time.perf_counter() - start, str(e))
+    return StepResult("ok", time.perf_counter() - start)
+
+
+def run_steps(steps: list[Step]) -> dict[str, StepResult]:
+    """
+    Run steps concurrently, each once the steps it depends on have finished.
+    
+    Only this (main) thread prints, so output lines never interleave.
+    
+    Args:
+        steps: Steps to run; dependencies must name steps in this list
+        
+    Returns:
+        Result of every step, in the order of ``steps``
+        
+    Raises:
+        ValueError: A dependency is unknown or the steps form a cycle
+    """
+    pending = {step.name: step for step in steps}
+    results: dict[str, StepResult] = {}
+    running: dict[Future, Step] = {}
+    
+    with ThreadPoolExecutor(max_workers=len(steps) or 1) as pool:
+        while pending or running:
+            for step in list(pending.values()):
+                if any(name not in results for name in step.requires + step.after):
+                    continue
+                del pending[step.name]
+                missing = [n for n in step.requires if results[n].status != "ok"]
+                if missing:
+                    results[step.name] = StepResult("skipped")
+                    print_warning(f"Skipped {step.name} ({', '.join(missing)} did not succeed)")
+                    continue
+                print_info(f"Started {step.name}")
+                running[pool.submit(run_step, step)] = step
+            
+            if not running:
+                if pending:
+                    raise ValueError(f"Unresolvable step dependencies: {', '.join(pending)}")
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                result = results[step.name] = future.result()
+                if result.status == "ok":
+                    print_success(f"{step.name} ({result.seconds:.1f}s)")
+                else:
+                    print_error(f"{step.name} failed: {result.error}")
+                    if step.hint:
+                        print_warning(step.hint)
+    
+    return {step.name: results[step.name] for step in steps}
+
+
+def print_timings(results: dict[str, StepResult], elapsed: float) -> None:
+    """Print how long each setup step took, and the wall-clock total."""
+    width = max(len(name) for name in results)
+    print(f"\n{BLUE}Setup timings{RESET}")
+    for name, result in results.items():
+        print(f"  {name:<{width}}  {result.status:<7}  {result.seconds:6.1f}s")
+    busy = sum(result.seconds for result in results.values())
+    print(f"  {'total':<{width}}  {'':<7}  {elapsed:6.1f}s ({busy:.1f}s of work)")
 
 
 def remove_unselected_apps() -> None:
@@ -85,6 +201,8 @@ def remove_unselected_apps() -> None:
     apps_to_remove = []
     if INCLUDE_ACCOUNTS == "no":
         apps_to_remove.append("accounts")
+    if USE_HUEY == "no":
+        apps_to_remove.append("housekeeping")
     
     if not apps_to_remove:
         return
@@ -97,6 +215,52 @@ def remove_unselected_apps() -> None:
             print_success(f"Removed {app}/")
 
 
+def remove_unselected_feature_files() -> None:
+    """Remove modules, tests and benchmarks of features that weren't selected."""
+    files_to_remove = []
+    if USE_HUEY == "no":
+        files_to_remove.append("tests/test_housekeeping.py")
+    if USE_REST_FRAMEWORK == "no":
+        files_to_remove.extend([
+            "config/renderers.py",
+            "config/parsers.py",
+            "config/serializers.py",
+            "config/views.py",
+            "accounts/serializers.py",
+            "accounts/urls.py",
+            "config/throttling.py",
+            "tests/test_json.py",
+            "tests/test_throttling.py",
+            "benchmarks/bench_json.py",
+            "benchmarks/bench_throttling.py",
+        ])
+    if INCLUDE_ACCOUNTS == "no":
+        files_to_remove.append("tests/test_export.py")
+    if USE_WEBSOCKETS == "no":
+        files_to_remove.extend([
+            "config/realtime.py",
+            "tests/test_realtime.py",
+            "benchmarks/bench_realtime.py",
+        ])
+    if USE_REST_FRAMEWORK == "no" or INCLUDE_ACCOUNTS == "no":
+        files_to_remove.extend([
+            "tests/test_serializers.py",
+            "tests/test_conditional.py",
+            "benchmarks/bench_serializers.py",
+            "benchmarks/bench_conditional.py",
+        ])
+    
+    if not files_to_remove:
+        return
+    
+    print_info("Removing files of unselected features...")
+    for file in files_to_remove:
+        file_path = Path(file)
+        if file_path.exists():
+            file_path.unlink()
+            print_success(f"Removed {file}")
+
+
 def remove_docker_files() -> None:
     """Remove Docker-related files if Docker support not selected."""
     if USE_DOCKER == "yes":
@@ -120,80 +284,86 @@ def remove_docker_files() -> None:
             print_success(f"Removed {directory}/")
 
 
-def initialize_git() -> None:
-    """Initialize git repository with initial commit."""
-    print_info("Initializing git repository...")
-    if not run_command("git init", "Failed to initialize git"):
-        return
-    
-    print_success("Git repository initialized")
-    
-    if run_command("git add .", "Failed to stage files"):
-        run_command(
-            'git commit -m "Initial commit from cookiecutter-django-lean template"',
-            "Failed to create initial commit"
-        )
-        print_success("Initial commit created")
-
-
-def setup_uv() -> bool:
-    """
-    Set up Python environment using uv package manager.
-    
-    Returns:
-        True if setup succeeded, False otherwise
-    """
-    print_info("Setting up Python environment with uv...")
-    
-    if not run_command("uv --version", "uv is not installed"):
-        print_warning(
-            "uv is not installed. Please install it with: pip install uv"
-        )
-        return False
-    
-    print_info(f"Pinning Python version to {PYTHON_VERSION}...")
-    if run_command(
-        f"uv python pin {PYTHON_VERSION}",
-        f"Failed to pin Python {PYTHON_VERSION}"
-    ):
-        print_success(f"Python {PYTHON_VERSION} pinned (.python-version created)")
-    
-    print_info("Installing dependencies...")
-    if run_command("uv sync", "Failed to install dependencies"):
-        print_success("Dependencies installed successfully")
-        return True
-    return False
+def commit_project() -> None:
+    """Create the initial commit with everything generated and installed."""
+    run_command(["git", "add", "--all"])
+    # Hooks may already be installed; the template is committed as generated.
+    run_command([
+        "git", "commit", "--quiet", "--no-verify",
+        "-m", "Initial commit from cookiecutter-django-lean template",
+    ])
 
 
 def create_env_file() -> None:
     """Create .env file from .env.example template if it doesn't exist."""
-    print_info("Creating .env file...")
     env_example = Path(".env.example")
     env_file = Path(".env")
     
     if env_example.exists() and not env_file.exists():
         shutil.copy(env_example, env_file)
-        print_success(".env file created from .env.example")
-        print_warning("Please update .env with your actual configuration values")
-    elif env_file.exists():
-        print_warning(".env file already exists, skipping...")
-
 
-def setup_pre_commit() -> None:
-    """Install pre-commit git hooks for code quality checks."""
-    print_info("Setting up pre-commit hooks...")
-    if run_command("uv run pre-commit install", "Failed to install pre-commit hooks"):
-        print_success("Pre-commit hooks installed")
 
-
-def create_migrations() -> None:
-    """Generate initial Django database migrations."""
-    print_info("Creating initial migrations...")
-    if run_command(
-        "uv run python manage.py makemigrations",
-        "Failed to create migrations"
-    ):
-        print_success("Initial migrations created")
+def setup_steps() -> list[Step]:
+    """
+    Return the setup steps and their dependencies.
+    
+    ``uv sync`` installs the dev and test extras, like the Dockerfile's
+    development image, so pre-commit and pytest are available. The git hook
+    is written by that pre-commit, so it runs from the project's virtualenv.
+    Online, ``uvx pre-commit install-hooks`` downloads the hook environments
+    (shared through pre-commit's own cache) alongside ``uv sync`` rather
+    than after it. Offline, they are installed on the first commit.
+    """
+    pre_commit = Step(
+        "pre-commit",
+        ["uv", "run", "--no-sync", "pre-commit", "install"],
+        requires=("git init", "uv sync"),
+    )
+    if OFFLINE:
+        sync_hint = "Offline mode (UV_OFFLINE) needs Python and all packages in the uv cache"
+        hook_steps = [pre_commit]
+    else:
+        sync_hint = ""
+        hook_steps = [
+            pre_commit,
+            Step(
+                "pre-commit envs",
+                ["uvx", "pre-commit", "install-hooks"],
+                requires=("git init", "uv"),
+                hint="Run `uv run pre-commit install-hooks` once online",
+            ),
+        ]
+    
+    return [
+        Step("git init", ["git", "init", "--quiet"]),
+        Step(".env", create_env_file),
+        Step(
+            "uv",
+            ["uv", "--version"],
+            hint="uv is not installed. Please install it with: pip install uv",
+        ),
+        Step("uv python pin", ["uv", "python", "pin", PYTHON_VERSION], requires=("uv",)),
+        Step(
+            "uv sync",
+            ["uv", "sync", "--extra", "dev", "--extra", "test"],
+            requires=("uv",),
+            after=("uv python pin",),
+            hint=sync_hint,
+        ),
+        *hook_steps,
+        Step(
+            "makemigrations",
+            ["uv", "run", "--no-sync", "python", "manage.py", "makemigrations"],
+            requires=("uv sync", ".env"),
+        ),
+        Step(
+            "git commit",
+            commit_project,
+            requires=("git init",),
+            after=(".env", "uv python pin", "uv sync", "makemigrations"),
+            hint="Set git user.name and user.email, then commit the project yourself",
+        ),
+    ]
 
 
 def print_next_steps() -> None:
@@ -247,17 +417,17 @@ def main() -> None:
     print(f"{BLUE}{'=' * 60}{RESET}\n")
     
     remove_unselected_apps()
+    remove_unselected_feature_files()
     remove_docker_files()
-    initialize_git()
-    create_env_file()
     
-    uv_success = setup_uv()
+    if OFFLINE:
+        print_info("Offline mode: uv only uses its local cache")
+    start = time.perf_counter()
+    results = run_steps(setup_steps())
+    print_timings(results, time.perf_counter() - start)
     
-    if uv_success:
-        setup_pre_commit()
-        create_migrations()
-    else:
-        print_warning("Skipping pre-commit and migrations setup due to uv issues")
+    if results[".env"].status == "ok":
+        print_warning("Please update .env with your actual configuration values")
     
     print_next_steps()
 
@@ -0,0 +1,408 @@
+"""
+Generate every combination of template options and check each project.
+
+Each variant takes one value for every choice in ``cookiecutter.json``.
+Variants run in parallel, and each one is:
+
+1. rendered with cookiecutter, including the post-generation hook (uv sync,
+   makemigrations, ...): the generation time
+2. checked with ``manage.py check``, i.e. Django set up with every app and
+   URL imported: the startup time
+3. tested with its own pytest suite: the test time
+
+Commands run with the variant's own ``.venv``, so the hook's setup is part
+of what is tested: a hook step that fails or is skipped fails the variant.
+``DATABASE_URL`` defaults to SQLite so that PostgreSQL variants run without
+a server.
+
+Results are written to a JSON report. Given an earlier report as
+``--baseline``, the run also fails when a variant that passed now fails or
+passes fewer tests, or when one of its timings grew by more than
+``--tolerance`` (plus ``--slack`` seconds, to absorb noise on fast steps).
+
+Usage:
+    python scripts/generation_matrix.py --list
+    python scripts/generation_matrix.py --only database=sqlite --only use_docker=no
+    python scripts/generation_matrix.py --offline --baseline matrix-baseline.json
+
+Exit codes:
+    0: Every variant passed and none regressed
+    1: A variant failed or regressed
+    2: Invalid arguments
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Final
+
+TEMPLATE_DIR: Final[Path] = Path(__file__).resolve().parent.parent
+PROJECT_NAME: Final[str] = "matrix"
+TIMINGS: Final[tuple[str, ...]] = ("generate", "startup", "test")
+# Lines of output kept from a failed command.
+ERROR_LINES: Final[int] = 20
+# A row of the hook's "Setup timings" table for a step that did not succeed.
+HOOK_STEP_FAILED: Final[re.Pattern[str]] = re.compile(
+    r"^  (?P<step>\S.*?)\s+(?P<status>failed|skipped)\s+[\d.]+s$", re.MULTILINE
+)
+
+
+@dataclass
+class VariantResult:
+    """Outcome and timings (in seconds) of one variant."""
+
+    context: dict[str, str]
+    status: str = "passed"
+    failed_step: str = ""
+    error: str = ""
+    tests_passed: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def load_choices(only: dict[str, str]) -> dict[str, list[str]]:
+    """
+    Return the choice variables of ``cookiecutter.json``, narrowed by ``only``.
+
+    Args:
+        only: Values to fix, e.g. ``{"database": "sqlite"}``
+
+    Raises:
+        ValueError: ``only`` names an unknown variable or value
+    """
+    config = json.loads((TEMPLATE_DIR / "cookiecutter.json").read_text())
+    choices = {
+        key: value
+        for key, value in config.items()
+        if isinstance(value, list) and not key.startswith("_")
+    }
+    for key, value in only.items():
+        if value not in choices.get(key, ()):
+            raise ValueError(f"{key}={value} is not a choice in cookiecutter.json")
+        choices[key] = [value]
+    return choices
+
+
+def build_variants(choices: dict[str, list[str]]) -> list[dict[str, str]]:
+    """Return every combination of the choices, defaults first."""
+    keys = sorted(choices)
+    return [
+        dict(zip(keys, values, strict=True))
+        for values in itertools.product(*(choices[key] for key in keys))
+    ]
+
+
+def variant_id(context: dict[str, str]) -> str:
+    return ",".join(f"{key}={value}" for key, value in sorted(context.items()))
+
+
+def variant_env(args: argparse.Namespace) -> dict[str, str]:
+    """Return the environment shared by every command of every variant."""
+    env = dict(os.environ)
+    # uv must target each variant's own .venv, not the one running this.
+    env.pop("VIRTUAL_ENV", None)
+    env["DATABASE_URL"] = args.database_url
+    if args.offline:
+        env["UV_OFFLINE"] = "1"
+    # The hook's initial commit needs an identity on machines without one.
+    for name in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        env.setdefault(name, "Generation Matrix")
+    for name in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        env.setdefault(name, "matrix@example.com")
+    return env
+
+
+def run_timed(
+    cmd: list[str], cwd: Path, env: dict[str, str], timeout: float
+) -> tuple[float, str]:
+    """
+    Run a command and return its duration and combined output.
+
+    Raises:
+        RuntimeError: The command failed, timed out or could not start; the
+            message holds the end of its output
+    """
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"timed out after {timeout:.0f}s") from None
+    except OSError as e:
+        raise RuntimeError(str(e)) from None
+    if process.returncode != 0:
+        lines = process.stdout.strip().splitlines()[-ERROR_LINES:]
+        raise RuntimeError("\n".join(lines) or f"exit code {process.returncode}")
+    return time.perf_counter() - start, process.stdout
+
+
+def hook_error(output: str, failed: list[tuple[str, str]]) -> str:
+    """Summarise the hook's failed steps, followed by the first error it printed."""
+    summary = ", ".join(f"{step} {status}" for step, status in failed)
+    lines = re.sub(r"\x1b\[[\d;]*m", "", output).splitlines()
+    first = next((i for i, line in enumerate(lines) if "✗" in line), len(lines))
+    return "\n".join([f"post-generation hook: {summary}", *lines[first:][:ERROR_LINES]])
+
+
+def project_python(project: Path) -> str:
+    if sys.platform == "win32":
+        return str(project / ".venv" / "Scripts" / "python.exe")
+    return str(project / ".venv" / "bin" / "python")
+
+
+def check_variant(
+    context: dict[str, str],
+    workdir: Path,
+    env: dict[str, str],
+    args: argparse.Namespace,
+) -> VariantResult:
+    """Generate, start and test one variant; never raises."""
+    result = VariantResult(context)
+    output_dir = workdir / hashlib.sha1(variant_id(context).encode()).hexdigest()[:12]
+    project = output_dir / PROJECT_NAME
+    python = project_python(project)
+    steps = {
+        "generate": (
+            [
+                sys.executable,
+                "-m",
+                "cookiecutter",
+                str(TEMPLATE_DIR),
+                "--no-input",
+                "--output-dir",
+                str(output_dir),
+                f"project_name={PROJECT_NAME}",
+                *(f"{key}={value}" for key, value in context.items()),
+            ],
+            workdir,
+        ),
+        "startup": ([python, "manage.py", "check"], project),
+        "test": ([python, "-m", "pytest", "-q", "-p", "no:cacheprovider"], project),
+    }
+    try:
+        for name, (cmd, cwd) in steps.items():
+            try:
+                result.timings[name], output = run_timed(cmd, cwd, env, args.timeout)
+            except RuntimeError as e:
+                result.status, result.failed_step, result.error = "failed", name, str(e)
+                break
+            if name == "generate" and (failed := HOOK_STEP_FAILED.findall(output)):
+                result.status, result.failed_step = "failed", name
+                result.error = hook_error(output, failed)
+                break
+        else:
+            passed = re.search(r"(\d+) passed", output)
+            result.tests_passed = int(passed.group(1)) if passed else 0
+    finally:
+        if not args.keep:
+            shutil.rmtree(output_dir, ignore_errors=True)
+    return result
+
+
+def find_regressions(
+    results: dict[str, dict], baseline: dict[str, dict], tolerance: float, slack: float
+) -> list[str]:
+    """
+    Compare results with a baseline report's variants.
+
+    Args:
+        results: Variant id -> result, as stored in a report
+        baseline: The same, from an earlier report
+        tolerance: Allowed relative growth of a timing, e.g. 0.25 for 25%
+        slack: Seconds added to the allowance
+
+    Returns:
+        One line per regression
+    """
+    regressions = []
+    for vid, result in results.items():
+        before = baseline.get(vid)
+        if before is None or before["status"] != "passed":
+            continue
+        if result["status"] != "passed":
+            regressions.append(f"{vid}: now fails at {result['failed_step']}")
+            continue
+        if result["tests_passed"] < before["tests_passed"]:
+            regressions.append(
+                f"{vid}: {before['tests_passed']} -> {result['tests_passed']} "
+                "tests passed"
+            )
+        for name in TIMINGS:
+            old, new = before["timings"].get(name), result["timings"].get(name)
+            if (
+                old is not None
+                and new is not None
+                and new > old * (1 + tolerance) + slack
+            ):
+                regressions.append(f"{vid}: {name} {old:.1f}s -> {new:.1f}s")
+    return regressions
+
+
+def format_result(result: VariantResult) -> str:
+    timings = "  ".join(
+        f"{name} {result.timings[name]:5.1f}s"
+        if name in result.timings
+        else f"{name}    - "
+        for name in TIMINGS
+    )
+    return f"{result.status:<6}  {timings}  {variant_id(result.context)}"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate and test every combination of template options.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="fix an option to one value (repeatable)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="variants run at the same time (default: CPU count)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="set UV_OFFLINE=1 for the hook: install from the uv cache only",
+    )
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:///data/db.sqlite3",
+        help="DATABASE_URL for every variant (default: %(default)s)",
+    )
+    parser.add_argument("--baseline", type=Path, help="earlier report to compare with")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("matrix-report.json"),
+        help="report to write (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative growth of a timing (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--slack",
+        type=float,
+        default=1.0,
+        help="seconds added to the allowed growth (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=900,
+        help="seconds before a command is abandoned (default: %(default)s)",
+    )
+    parser.add_argument("--workdir", type=Path, help="where variants are generated")
+    parser.add_argument("--keep", action="store_true", help="keep generated projects")
+    parser.add_argument("--list", action="store_true", help="list variants and exit")
+    args = parser.parse_args(argv)
+
+    only = {}
+    for item in args.only:
+        key, sep, value = item.partition("=")
+        if not sep:
+            parser.error(f"--only expects KEY=VALUE, got {item!r}")
+        only[key] = value
+    try:
+        args.variants = build_variants(load_choices(only))
+    except ValueError as e:
+        parser.error(str(e))
+    if args.baseline and not args.baseline.is_file():
+        parser.error(f"baseline {args.baseline} does not exist")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.list:
+        for context in args.variants:
+            print(variant_id(context))
+        return 0
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="matrix-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    env = variant_env(args)
+    total = len(args.variants)
+    print(f"Running {total} variants, {args.jobs} at a time, in {workdir}")
+
+    start = time.perf_counter()
+    results: dict[str, VariantResult] = {}
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [
+            pool.submit(check_variant, context, workdir, env, args)
+            for context in args.variants
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results[variant_id(result.context)] = result
+            progress = f"[{done:>{len(str(total))}}/{total}]"
+            print(f"{progress} {format_result(result)}", flush=True)
+            if result.error:
+                print("    " + result.error.replace("\n", "\n    "))
+    elapsed = time.perf_counter() - start
+    if not args.keep and not args.workdir:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": args.jobs,
+        "offline": args.offline,
+        "elapsed": round(elapsed, 1),
+        "variants": {vid: asdict(results[vid]) for vid in sorted(results)},
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    failed = [vid for vid, result in results.items() if result.status != "passed"]
+    print(f"\n{total - len(failed)}/{total} variants passed in {elapsed:.0f}s")
+    for name in TIMINGS:
+        values = sorted(r.timings[name] for r in results.values() if name in r.timings)
+        if values:
+            print(
+                f"  {name:<8}  median {values[len(values) // 2]:5.1f}s"
+                f"  max {values[-1]:5.1f}s"
+            )
+    print(f"Report written to {args.output}")
+
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["variants"]
+        regressions = find_regressions(
+            report["variants"], baseline, args.tolerance, args.slack
+        )
+        print(f"\n{len(regressions)} regressions against {args.baseline}")
+        for line in regressions:
+            print(f"  {line}")
+
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 
+from .export import export_response
 from .models import User
 
 
@@ -42,3 +43,16 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ("is_staff", "is_superuser", "is_active", "groups")
     search_fields = ("email", "first_name", "last_name")
     ordering = ("email",)
+    actions = ("export_csv", "export_jsonl")
+
+    @admin.action(permissions=["view"], description=_("Export selected users as CSV"))
+    def export_csv(self, request, queryset):
+        """Stream the selected users as a CSV download."""
+        return export_response(request, queryset, "csv")
+
+    @admin.action(
+        permissions=["view"], description=_("Export selected users as JSON Lines")
+    )
+    def export_jsonl(self, request, queryset):
+        """Stream the selected users as a JSON Lines download."""
+        return export_response(request, queryset, "jsonl")
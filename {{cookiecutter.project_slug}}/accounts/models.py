@@ -73,6 +73,8 @@ class User(AbstractUser):
 
     username = None
     email = models.EmailField(_("email address"), unique=True)
+    # Bumped on every save(); API views derive their ETags from it.
+    updated_at = models.DateTimeField(_("updated at"), auto_now=True, db_index=True)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
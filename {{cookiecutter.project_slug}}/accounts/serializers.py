@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
+from config.serializers import FastReadModelSerializer
+
 User = get_user_model()
 
 
@@ -33,9 +35,12 @@ class LoginSerializer(DJRestAuthLoginSerializer):
             ) from None
 
 
-class UserDetailsSerializer(serializers.ModelSerializer):
+class UserDetailsSerializer(FastReadModelSerializer):
     """
     Serializer for the user detail view (e.g., /api/v1/auth/user/).
+
+    Reads go through the precompiled fast path; lists of users are rendered
+    from ``values_list()`` rows without building model instances.
     """
 
     class Meta:
@@ -2,8 +2,16 @@
 Signal handlers for accounts app.
 """
 from django.conf import settings
+{%- if cookiecutter.use_websockets == "yes" %}
+from django.db.models.signals import post_delete, post_save
+{%- else %}
 from django.db.models.signals import post_save
+{%- endif %}
 from django.dispatch import receiver
+{%- if cookiecutter.use_websockets == "yes" %}
+
+from config.realtime import USERS_GROUP, publish, user_group
+{%- endif %}
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -15,3 +23,24 @@ def user_post_save(sender, instance, created, **kwargs):
     if created:
         # User was just created
         pass
+{%- if cookiecutter.use_websockets == "yes" %}
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def publish_user_change(sender, instance, **kwargs):
+    """
+    Notify the user's sockets and the "users" topic that a user changed.
+
+    Only the change and the id are sent; clients refetch what they display.
+    """
+    if kwargs.get("raw"):
+        return
+    if kwargs["signal"] is post_delete:
+        change = "deleted"
+    else:
+        change = "created" if kwargs["created"] else "updated"
+    message = {"type": f"user.{change}", "id": instance.pk}
+    publish(user_group(instance.pk), message)
+    publish(USERS_GROUP, message)
+{%- endif %}
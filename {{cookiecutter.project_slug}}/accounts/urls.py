@@ -0,0 +1,17 @@
+"""
+URL configuration for accounts app.
+"""
+from django.urls import path, re_path
+
+from .views import UserExportView, UserListView
+
+app_name = "accounts"
+
+urlpatterns = [
+    path("", UserListView.as_view(), name="user-list"),
+    re_path(
+        r"^export\.(?P<export_format>csv|jsonl)$",
+        UserExportView.as_view(),
+        name="user-export",
+    ),
+]
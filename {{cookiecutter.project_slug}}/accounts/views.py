@@ -1,6 +1,45 @@
 """
 Views for accounts app.
 """
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from dj_rest_auth.views import UserDetailsView as BaseUserDetailsView
+from django.contrib.auth import get_user_model
+from rest_framework import generics, permissions
+from rest_framework.views import APIView
+
+from config.views import ConditionalGetMixin, FastListModelMixin
+
+from .export import export_response
+from .serializers import UserDetailsSerializer
+
+User = get_user_model()
+
+
+class UserListView(ConditionalGetMixin, FastListModelMixin, generics.ListAPIView):
+    """Paginated list of users, for staff only."""
+
+    queryset = User.objects.order_by("id")
+    serializer_class = UserDetailsSerializer
+    permission_classes = (permissions.IsAdminUser,)
+
+
+class UserDetailsView(ConditionalGetMixin, BaseUserDetailsView):
+    """dj-rest-auth's current user endpoint, answering conditional GETs."""
+
+    def get_validators(self, request):
+        # The user was loaded by authentication: no extra query.
+        return request.user.updated_at, ()
+
+
+class UserExportView(APIView):
+    """Stream all users as CSV or JSON Lines, for staff only."""
+
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request, export_format: str):
+        return export_response(request, User.objects.all(), export_format)
+{%- else %}
 from django.shortcuts import render
 
 # Create your views here.
+{%- endif %}
@@ -0,0 +1,83 @@
+"""
+Cost of a full user list response versus a 304 revalidation, and gzip.
+
+Seeds 1,000 users in a throwaway test database, then times GET /api/users/
+(100 users per page) as a staff client, once without validators and once
+revalidating with If-None-Match. Also reports the size of the page with
+and without gzip.
+
+    uv run python -m benchmarks.bench_conditional
+"""
+
+from benchmarks.utils import measure, print_results, setup_django, test_database
+
+ROWS = 1_000
+PAGE_SIZE = 100
+
+
+def main() -> None:
+    setup_django()
+
+    import logging
+
+    from django.contrib.auth import get_user_model
+    from django.test import override_settings
+    from rest_framework.pagination import PageNumberPagination
+    from rest_framework.test import APIClient
+
+    from accounts.views import UserListView
+
+    User = get_user_model()
+    # Neither access logs nor rate limits are what is measured here.
+    logging.disable(logging.INFO)
+    UserListView.throttle_classes = ()
+    UserListView.pagination_class = type(
+        "BenchPagination", (PageNumberPagination,), {"page_size": PAGE_SIZE}
+    )
+
+    with test_database(), override_settings(GZIP_MIN_LENGTH=0):
+        User.objects.bulk_create(
+            User(email=f"user{i}@example.com", first_name="Kirabo", last_name="Ibrahim")
+            for i in range(ROWS)
+        )
+        staff = User.objects.create_superuser(email="admin@example.com", password="pw")
+        client = APIClient()
+        client.force_authenticate(staff)
+
+        full = client.get("/api/users/")
+        etag = full["ETag"]
+        compressed = client.get("/api/users/", HTTP_ACCEPT_ENCODING="gzip")
+
+        print_results(
+            f"GET /api/users/ ({PAGE_SIZE} of {ROWS} users)",
+            [
+                ("200 full response", measure(lambda: client.get("/api/users/"), 200)),
+                (
+                    "304 If-None-Match",
+                    measure(
+                        lambda: client.get("/api/users/", HTTP_IF_NONE_MATCH=etag), 200
+                    ),
+                ),
+                (
+                    "200 gzip",
+                    measure(
+                        lambda: client.get("/api/users/", HTTP_ACCEPT_ENCODING="gzip"),
+                        200,
+                    ),
+                ),
+            ],
+            unit="µs/request",
+        )
+        print_results(
+            "Response body size",
+            [
+                ("identity", len(full.content)),
+                ("gzip", len(compressed.content)),
+                ("304", 0),
+            ],
+            unit="bytes",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Render and parse throughput of the orjson and stdlib REST framework classes.
+
+    uv run python -m benchmarks.bench_json
+"""
+
+import datetime
+import decimal
+import io
+import uuid
+
+from benchmarks.utils import measure, print_results, setup_django
+
+
+def user_rows(count: int) -> list[dict]:
+    """Rows shaped like serializer output for a paginated user list."""
+    return [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "first_name": "Kirabo",
+            "last_name": "Ibrahim",
+            "date_joined": "2024-01-02T03:04:05.123456Z",
+            "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+
+def native_rows(count: int) -> list[dict]:
+    """Rows holding Python objects that need encoder support."""
+    from django.utils.translation import gettext_lazy as _
+
+    now = datetime.datetime.now(datetime.UTC)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "created": now,
+            "price": decimal.Decimal("19.99"),
+            "status": _("active"),
+        }
+        for _i in range(count)
+    ]
+
+
+def main() -> None:
+    setup_django()
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from config.parsers import ORJSONParser
+    from config.renderers import ORJSONRenderer
+
+    for size in (10, 1_000):
+        number = max(10, 20_000 // size)
+        for label, rows in (
+            ("serializer output", user_rows(size)),
+            ("native types", native_rows(size)),
+        ):
+            data = {"count": size, "next": None, "previous": None, "results": rows}
+            print_results(
+                f"Render {size} rows, {label} ({number} calls)",
+                [
+                    (cls.__name__, measure(lambda c=cls, d=data: c().render(d), number))
+                    for cls in (JSONRenderer, ORJSONRenderer)
+                ],
+            )
+
+        body = JSONRenderer().render({"results": user_rows(size)})
+        print_results(
+            f"Parse {size} rows ({len(body)} bytes, {number} calls)",
+            [
+                (
+                    cls.__name__,
+                    measure(lambda c=cls, b=body: c().parse(io.BytesIO(b)), number),
+                )
+                for cls in (JSONParser, ORJSONParser)
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
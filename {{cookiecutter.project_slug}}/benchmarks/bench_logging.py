@@ -0,0 +1,92 @@
+"""
+Per-call overhead of a log statement on the request path.
+
+Compares writing synchronously from the calling thread with the queue-based
+handlers configured in ``settings.LOGGING``. The "slow sink" rows simulate a
+stream whose writes block (a full pipe, a remote syslog, a busy disk).
+
+    uv run python -m benchmarks.bench_logging
+"""
+
+import io
+import logging
+import os
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from benchmarks.utils import measure, print_results
+from config.log import JSONFormatter, NonBlockingQueueHandler, RequestContextFilter
+
+SLOW_WRITE_SECONDS = 0.0002
+
+
+class SlowStream(io.TextIOBase):
+    """Text stream whose every write blocks for a fixed time."""
+
+    def write(self, s: str) -> int:
+        time.sleep(SLOW_WRITE_SECONDS)
+        return len(s)
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    handler.addFilter(RequestContextFilter())
+    logger = logging.getLogger(f"benchmarks.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def sync_logger(name: str, stream) -> logging.Logger:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    return make_logger(name, handler)
+
+
+def queued_logger(name: str, stream, handler_class=NonBlockingQueueHandler):
+    target = logging.StreamHandler(stream)
+    target.setFormatter(JSONFormatter())
+    queue = SimpleQueue()
+    listener = QueueListener(queue, target)
+    listener.start()
+    return make_logger(name, handler_class(queue)), listener
+
+
+def main() -> None:
+    number = 20_000
+    slow_number = 200
+    devnull = open(os.devnull, "w")  # noqa: SIM115
+
+    sync = sync_logger("sync", devnull)
+    stdlib_queue, stdlib_listener = queued_logger("stdlib_queue", devnull, QueueHandler)
+    queued, listener = queued_logger("queued", devnull)
+    slow_sync = sync_logger("slow_sync", SlowStream())
+    slow_queued, slow_listener = queued_logger("slow_queued", SlowStream())
+
+    def log(logger):
+        return lambda: logger.info("user %s logged in from %s", 42, "127.0.0.1")
+
+    print_results(
+        f"Log call overhead, fast sink ({number} calls)",
+        [
+            ("StreamHandler (sync)", measure(log(sync), number)),
+            ("QueueHandler (stdlib)", measure(log(stdlib_queue), number)),
+            ("NonBlockingQueueHandler", measure(log(queued), number)),
+        ],
+    )
+    print_results(
+        f"Log call overhead, slow sink ({slow_number} calls)",
+        [
+            ("StreamHandler (sync)", measure(log(slow_sync), slow_number, 3)),
+            ("NonBlockingQueueHandler", measure(log(slow_queued), slow_number, 3)),
+        ],
+    )
+
+    for each in (stdlib_listener, listener, slow_listener):
+        each.stop()
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Python worker time to deliver a protected file: FileResponse vs X-Accel-Redirect.
+
+For files of several sizes, builds the response with
+``config.media.protected_file_response`` and sends it through Django's ASGI
+handler to a stub server that only counts bytes, as daphne would receive
+it. With ``FileResponse`` the worker reads every chunk in a thread and sends
+it; with ``X-Accel-Redirect`` it only sends headers, and nginx then sends the
+file with ``sendfile`` outside Python. Real servers add socket writes on top
+of the ``FileResponse`` numbers, so they are a lower bound.
+
+    uv run python -m benchmarks.bench_media
+"""
+
+import asyncio
+import os
+import tempfile
+
+from benchmarks.utils import measure, print_results, setup_django
+
+SIZES_MIB = (1, 16, 128)
+
+
+class CountingSend:
+    """ASGI ``send`` callable recording the number of body bytes sent."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    async def __call__(self, message: dict) -> None:
+        self.bytes += len(message.get("body", b""))
+
+
+class Server:
+    """Runs Django's ASGI response sending against ``CountingSend``."""
+
+    def __init__(self):
+        from django.core.handlers.asgi import ASGIHandler
+        from django.test import AsyncRequestFactory
+
+        self.handler = ASGIHandler()
+        self.loop = asyncio.new_event_loop()
+        self.request = AsyncRequestFactory().get("/")
+
+    def deliver(self, name: str) -> int:
+        """Build and send one response for ``name``; return the body bytes sent."""
+        from config.media import protected_file_response
+
+        response = protected_file_response(self.request, name)
+        send = CountingSend()
+        self.loop.run_until_complete(self.handler.send_response(response, send))
+        return send.bytes
+
+    def time(self, name: str, prefix: str, number: int) -> float:
+        """Time ``deliver()`` with the given X-Accel-Redirect prefix."""
+        from django.test import override_settings
+
+        with override_settings(PROTECTED_MEDIA_X_ACCEL_PREFIX=prefix):
+            return measure(lambda: self.deliver(name), number, repeat=3)
+
+
+def main() -> None:
+    setup_django()
+
+    from django.test import override_settings
+
+    server = Server()
+    throughput = []
+
+    with (
+        tempfile.TemporaryDirectory() as root,
+        override_settings(PROTECTED_MEDIA_ROOT=root, PROTECTED_MEDIA_X_ACCEL_PREFIX=""),
+    ):
+        for size in SIZES_MIB:
+            name = f"bench-{size}.bin"
+            with open(os.path.join(root, name), "wb") as f:
+                f.write(os.urandom(size * 1024 * 1024))
+            # Warm the page cache so disk reads are not what is measured.
+            assert server.deliver(name) == size * 1024 * 1024
+
+            file_time = server.time(name, "", number=max(1, 64 // size))
+            accel_time = server.time(name, "/_protected/", number=1_000)
+            print_results(
+                f"Deliver a {size} MiB file (worker time)",
+                [("FileResponse", file_time), ("X-Accel-Redirect", accel_time)],
+                unit="µs/request",
+            )
+            throughput.append((f"{size} MiB", size / file_time * 1_000_000))
+
+    print_results("FileResponse worker throughput", throughput, unit="MiB/s")
+    server.loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Cost of on-demand profiling: untriggered requests, queries, profiled requests.
+
+Calls a small view directly and through ``profiling_middleware`` without
+asking for a profile, which is what every production request pays. Then
+times a query with and without the ``record_query`` execute wrapper that
+every connection carries, and finally a request profiled through a signed
+``X-Profile`` header, including writing its report.
+
+    uv run python -m benchmarks.bench_profiling
+"""
+
+import tempfile
+
+from benchmarks.utils import measure, print_results, setup_django, test_database
+
+QUERIES_PER_VIEW = 20
+
+
+def main() -> None:
+    setup_django()
+
+    from django.db import connection
+    from django.http import HttpResponse
+    from django.test import RequestFactory, override_settings
+
+    from profiling.middleware import make_token, profiling_middleware
+    from profiling.profiler import record_query
+
+    def view(request):
+        if request.queries:
+            with connection.cursor() as cursor:
+                for _ in range(request.queries):
+                    cursor.execute("SELECT 1")
+        return HttpResponse("OK")
+
+    middleware = profiling_middleware(view)
+    factory = RequestFactory()
+    plain = factory.get("/")
+    plain.queries = 0
+
+    print_results(
+        "Request not asking for a profile",
+        [
+            ("view only", measure(lambda: view(plain), number=100_000)),
+            ("through middleware", measure(lambda: middleware(plain), number=100_000)),
+        ],
+        unit="µs/request",
+    )
+
+    with test_database(), connection.cursor() as cursor:
+        wrappers = connection.execute_wrappers
+        timings = []
+        for label, installed in (("no wrapper", []), ("record_query", [record_query])):
+            connection.execute_wrappers = installed
+            timings.append((label, measure(lambda: cursor.execute("SELECT 1"))))
+        connection.execute_wrappers = wrappers
+        print_results("Query outside a profile", timings, unit="µs/query")
+
+        profiled = factory.get("/", headers={"X-Profile": make_token()})
+        profiled.queries = plain.queries = QUERIES_PER_VIEW
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            override_settings(PROFILING_DIR=directory),
+        ):
+            not_profiled = measure(lambda: middleware(plain), number=200)
+            with_report = measure(lambda: middleware(profiled), number=200)
+        print_results(
+            f"Request running {QUERIES_PER_VIEW} queries",
+            [("not profiled", not_profiled), ("profiled, report saved", with_report)],
+            unit="µs/request",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Connection capacity and fan-out latency of the realtime consumer, per worker.
+
+Opens increasing numbers of /ws/updates/ connections in one event loop (as
+one daphne process would hold them) and reports the time to accept each
+and the Python memory each keeps while idle. Then subscribes them all to
+the ``users`` topic and times one published message until every socket
+has received it, through the configured channel layer, and compares
+``LocalChannelLayer`` with channels' stock ``InMemoryChannelLayer``.
+
+Connections are driven in-process with ``WebsocketCommunicator``, so
+network I/O and daphne's own per-connection objects are not included, while
+the communicators' own queues and timeouts are. A shared channel layer adds
+a round-trip per group operation.
+
+    uv run python -m benchmarks.bench_realtime
+"""
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from benchmarks.utils import print_results, setup_django
+
+CONNECTIONS = (100, 1_000, 5_000)
+COMPARE_CONNECTIONS = 1_000
+FANOUT_ROUNDS = 5
+LOCAL_LAYER = "config.realtime.LocalChannelLayer"
+
+
+async def open_sockets(count: int) -> tuple[list, float]:
+    """
+    Connect ``count`` staff sockets subscribed to the ``users`` topic.
+
+    Returns:
+        ``(sockets, µs per connection)``
+    """
+    from channels.testing import WebsocketCommunicator
+
+    from config.realtime import UpdatesConsumer
+
+    app = UpdatesConsumer.as_asgi()
+    sockets = []
+    start = time.perf_counter()
+    for i in range(count):
+        socket = WebsocketCommunicator(app, "/ws/updates/")
+        socket.scope["user"] = SimpleNamespace(
+            pk=i, is_authenticated=True, is_staff=True
+        )
+        connected, _ = await socket.connect()
+        assert connected
+        sockets.append(socket)
+    elapsed = time.perf_counter() - start
+
+    for socket in sockets:
+        await socket.send_json_to({"action": "subscribe", "topic": "users"})
+    for socket in sockets:
+        await socket.receive_json_from()
+    return sockets, elapsed / count * 1_000_000
+
+
+async def idle_memory(count: int) -> float:
+    """Return the Python memory, in bytes, held per idle subscribed socket."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sockets, _ = await open_sockets(count)
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    await close(sockets)
+    return memory / count
+
+
+async def close(sockets: list) -> None:
+    for socket in sockets:
+        await socket.disconnect()
+
+
+async def fan_out(sockets: list) -> float:
+    """Return the median time, in ms, for one message to reach every socket."""
+    from channels.layers import get_channel_layer
+
+    from config.realtime import USERS_GROUP
+
+    channel_layer = get_channel_layer()
+    event = {"type": "publish.message", "message": {"type": "user.updated", "id": 1}}
+    timings = []
+    for _ in range(FANOUT_ROUNDS):
+        start = time.perf_counter()
+        await channel_layer.group_send(USERS_GROUP, event)
+        await asyncio.gather(
+            *(socket.receive_json_from(timeout=30) for socket in sockets)
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1_000
+
+
+async def run() -> None:
+    from django.test import override_settings
+
+    connect, latency = [], []
+    for count in CONNECTIONS:
+        sockets, connect_time = await open_sockets(count)
+        label = f"{count:,} sockets"
+        connect.append((label, connect_time))
+        latency.append((label, await fan_out(sockets)))
+        await close(sockets)
+
+    per_socket = await idle_memory(COMPARE_CONNECTIONS)
+    print_results("Accept a connection", connect, unit="µs/connection")
+    print_results(
+        "Python memory per idle connection",
+        [(f"{COMPARE_CONNECTIONS:,} sockets", per_socket / 1024)],
+        unit="KiB",
+    )
+    print_results("Fan out one message to all sockets", latency, unit="ms")
+
+    layers = []
+    for backend in ("channels.layers.InMemoryChannelLayer", LOCAL_LAYER):
+        with override_settings(CHANNEL_LAYERS={"default": {"BACKEND": backend}}):
+            sockets, _ = await open_sockets(COMPARE_CONNECTIONS)
+            layers.append((backend.rsplit(".", 1)[1], await fan_out(sockets)))
+            await close(sockets)
+    print_results(
+        f"Fan out to {COMPARE_CONNECTIONS:,} sockets by channel layer",
+        layers,
+        unit="ms",
+    )
+
+
+def main() -> None:
+    setup_django()
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
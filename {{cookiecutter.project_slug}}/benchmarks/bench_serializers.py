@@ -0,0 +1,56 @@
+"""
+List serialization cost of UserDetailsSerializer versus a plain ModelSerializer.
+
+Seeds 10,000 users in a throwaway test database and times serializing all of
+them, once from a fresh queryset (query included) and once from instances that
+are already loaded.
+
+    uv run python -m benchmarks.bench_serializers
+"""
+
+from benchmarks.utils import measure, print_results, setup_django, test_database
+
+ROWS = 10_000
+
+
+def main() -> None:
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from rest_framework import serializers
+
+    from accounts.serializers import UserDetailsSerializer
+
+    User = get_user_model()
+
+    class PlainUserSerializer(serializers.ModelSerializer):
+        class Meta:
+            model = User
+            fields = UserDetailsSerializer.Meta.fields
+
+    with test_database():
+        User.objects.bulk_create(
+            User(email=f"user{i}@example.com", first_name="Kirabo", last_name="Ibrahim")
+            for i in range(ROWS)
+        )
+        instances = list(User.objects.order_by("id"))
+        sources = (
+            ("a fresh queryset", lambda: User.objects.order_by("id")),
+            ("already loaded instances", lambda: instances),
+        )
+        for label, source in sources:
+            print_results(
+                f"Serialize {ROWS} users from {label}",
+                [
+                    (
+                        cls.__name__,
+                        measure(lambda c=cls, s=source: c(s(), many=True).data, 1, 5),
+                    )
+                    for cls in (PlainUserSerializer, UserDetailsSerializer)
+                ],
+                unit="µs/list",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Per-request overhead of each session engine.
+
+Runs a request through ``SessionMiddleware`` with an existing session
+cookie, once for a view that only reads the session and once for a view
+that modifies it (which forces a save).
+
+    uv run python -m benchmarks.bench_sessions
+"""
+
+from benchmarks.utils import measure, print_results, setup_django, test_database
+
+ENGINES = ("db", "cached_db", "cache", "signed_cookies")
+
+
+def session_request(engine: str, write: bool):
+    """Return a callable performing one request with a live session."""
+    from django.conf import settings
+    from django.contrib.sessions.middleware import SessionMiddleware
+    from django.http import HttpResponse
+    from django.test import RequestFactory, override_settings
+
+    def view(request):
+        count = request.session.get("count", 0)
+        if write:
+            request.session["count"] = count + 1
+        return HttpResponse()
+
+    with override_settings(SESSION_ENGINE=f"django.contrib.sessions.backends.{engine}"):
+        middleware = SessionMiddleware(view)
+
+    factory = RequestFactory()
+    first = factory.get("/")
+    first.session = middleware.SessionStore()
+    first.session["count"] = 0
+    first.session.save()
+    cookie = first.session.session_key
+
+    def request():
+        # Follow cookie updates; with signed_cookies the cookie *is* the session.
+        nonlocal cookie
+        req = factory.get("/")
+        req.COOKIES[settings.SESSION_COOKIE_NAME] = cookie
+        response = middleware(req)
+        if settings.SESSION_COOKIE_NAME in response.cookies:
+            cookie = response.cookies[settings.SESSION_COOKIE_NAME].value
+        return response
+
+    return request
+
+
+def main() -> None:
+    setup_django()
+    number = 2_000
+
+    with test_database():
+        for write in (False, True):
+            title = "read + write" if write else "read only"
+            print_results(
+                f"Session overhead per request, {title} ({number} requests)",
+                [
+                    (engine, measure(session_request(engine, write), number, 3))
+                    for engine in ENGINES
+                ],
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Per-request overhead of DRF's UserRateThrottle versus the token-bucket one.
+
+A client sends requests just under the allowed rate (a simulated clock
+advances between checks), so DRF's timestamp history stays full. Besides
+the time per check with the local-memory cache, the number of cache calls
+per check is reported: with Memcached each one is a round-trip, and DRF's
+``set`` sends the whole history. With the Redis cache, the token bucket makes
+one script call per check instead.
+
+    uv run python -m benchmarks.bench_throttling
+"""
+
+from benchmarks.utils import measure, print_results, setup_django
+
+RATES = ("60/min", "1000/min", "10000/min")
+
+
+class Clock:
+    """Clock advancing by ``step`` seconds each time it is read."""
+
+    def __init__(self, step: float):
+        self.now = 1_000_000.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+class CountingCache:
+    """Cache proxy counting the calls made through it."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.calls = 0
+
+    def __getattr__(self, name):
+        method = getattr(self.cache, name)
+
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return method(*args, **kwargs)
+
+        return counted
+
+
+def throttle_check(base, rate: str, request):
+    """Return a callable running one check, and the cache it counts calls on."""
+    from django.core.cache import cache
+
+    num_requests, duration = base.parse_rate(None, rate)
+    counting = CountingCache(cache)
+    throttle_class = type(
+        base.__name__,
+        (base,),
+        {
+            "rate": rate,
+            "cache": counting,
+            "timer": Clock(step=duration / num_requests * 1.01),
+        },
+    )
+
+    def check():
+        if not throttle_class().allow_request(request, None):
+            raise AssertionError("benchmark client was throttled")
+
+    cache.clear()
+    for _ in range(num_requests):
+        check()
+    counting.calls = 0
+    return check, counting
+
+
+def main() -> None:
+    setup_django()
+
+    from rest_framework import throttling
+    from rest_framework.test import APIRequestFactory
+    from rest_framework.views import APIView
+
+    from config.throttling import UserRateThrottle
+
+    request = APIView().initialize_request(APIRequestFactory().get("/"))
+    request.user  # noqa: B018 - authenticate once, outside the timings
+
+    for rate in RATES:
+        times, calls = [], []
+        for base in (throttling.UserRateThrottle, UserRateThrottle):
+            check, counting = throttle_check(base, rate, request)
+            label = f"{base.__module__.split('.')[0]}.{base.__name__}"
+            times.append((label, measure(check, number=2_000)))
+            calls.append((label, counting.calls / (2_000 * 5)))
+
+        print_results(f"Throttle check at {rate}", times)
+        print_results(f"Cache calls per check at {rate}", calls, unit="calls")
+
+
+if __name__ == "__main__":
+    main()
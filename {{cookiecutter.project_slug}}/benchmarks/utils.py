@@ -0,0 +1,71 @@
+"""
+Shared helpers for the scripts in ``benchmarks/``.
+
+Run a benchmark from the project root, e.g.::
+
+    uv run python -m benchmarks.bench_logging
+"""
+
+import os
+import timeit
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+
+def setup_django() -> None:
+    """Configure Django for a standalone benchmark script."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def test_database() -> Iterator[None]:
+    """
+    Run the enclosed benchmark against a freshly migrated test database.
+
+    Uses the same ``test_`` database pytest-django would create, so real data
+    is never touched. With SQLite the test database lives in memory.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func: Callable[[], object], number: int = 10_000, repeat: int = 5) -> float:
+    """
+    Time ``func`` and return the best per-call duration in microseconds.
+
+    Args:
+        func: Zero-argument callable to time
+        number: Calls per timing run
+        repeat: Number of timing runs; the fastest one is reported
+
+    Returns:
+        Per-call duration in microseconds
+    """
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number * 1_000_000
+
+
+def print_results(
+    title: str, rows: list[tuple[str, float]], unit: str = "µs/call"
+) -> None:
+    """Print a small aligned results table, relative to the first row."""
+    print(f"\n{title}")
+    print("-" * len(title))
+    width = max(len(label) for label, _ in rows)
+    baseline = rows[0][1]
+    for label, value in rows:
+        ratio = f"{value / baseline:.2f}x" if baseline else "-"
+        print(f"{label:<{width}}  {value:>12.2f} {unit}  ({ratio})")
@@ -13,4 +13,37 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
+{%- if cookiecutter.use_websockets == "yes" %}
+# Set up Django before importing consumers, which may import models.
+django_asgi_app = get_asgi_application()
+
+from channels.auth import AuthMiddlewareStack  # noqa: E402
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import AllowedHostsOriginValidator  # noqa: E402
+
+from config.realtime import (  # noqa: E402
+{%- if cookiecutter.use_rest_framework == "yes" %}
+    JWTCookieAuthMiddleware,
+{%- endif %}
+    websocket_urlpatterns,
+)
+
+application = ProtocolTypeRouter(
+    {
+        "http": django_asgi_app,
+        # Cookies authenticate sockets, so only accept handshakes whose
+        # Origin is one of ALLOWED_HOSTS.
+        "websocket": AllowedHostsOriginValidator(
+{%- if cookiecutter.use_rest_framework == "yes" %}
+            AuthMiddlewareStack(
+                JWTCookieAuthMiddleware(URLRouter(websocket_urlpatterns))
+            )
+{%- else %}
+            AuthMiddlewareStack(URLRouter(websocket_urlpatterns))
+{%- endif %}
+        ),
+    }
+)
+{%- else %}
 application = get_asgi_application()
+{%- endif %}
@@ -0,0 +1,214 @@
+"""
+Logging helpers for {{ cookiecutter.project_name }}.
+
+Request threads and the event loop only ever put records on an in-memory
+queue; a ``QueueListener`` thread formats them as JSON and does the I/O.
+"""
+
+import atexit
+import json
+import logging
+import logging.config
+import random
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from asgiref.sync import iscoroutinefunction
+from django.utils.decorators import sync_and_async_middleware
+from django.utils.functional import empty
+
+access_logger = logging.getLogger(__name__ + ".access")
+
+# Per-request state read by RequestContextFilter: (request_id, request, start).
+_request_context: ContextVar[tuple | None] = ContextVar("request_context", default=None)
+
+_listeners: list[QueueListener] = []
+
+
+def configure_logging(logging_settings: dict) -> None:
+    """
+    Apply ``settings.LOGGING`` and start the listeners of queue handlers.
+
+    Used as ``LOGGING_CONFIG``; Python's ``dictConfig`` builds the listener
+    for every ``QueueHandler`` that declares ``handlers`` but leaves starting
+    it to the caller.
+    """
+    while _listeners:
+        _listeners.pop().stop()
+
+    logging.config.dictConfig(logging_settings)
+
+    for name in logging.getHandlerNames():
+        listener = getattr(logging.getHandlerByName(name), "listener", None)
+        if listener is not None:
+            listener.start()
+            _listeners.append(listener)
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Flush queued records before the interpreter exits."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that defers formatting to the listener thread.
+
+    The stock ``QueueHandler.prepare`` runs the full formatter (including
+    tracebacks) in the calling thread and copies the record so it can be
+    pickled. Records never leave the process here, so only the message
+    arguments are merged, in place, which leaves ``getMessage()`` unchanged
+    for any other handler.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Attach request id, user id, route and elapsed time to every record.
+
+    Must be installed on the queue handler (not the listener's handlers) so
+    that it runs in the thread that owns the request context.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _request_context.get()
+        if context is None:
+            record.request_id = record.user_id = record.route = None
+            record.duration_ms = getattr(record, "duration_ms", None)
+            return True
+
+        request_id, request, start = context
+        record.request_id = request_id
+        record.user_id = _get_user_id(request)
+        record.route = _get_route(request)
+        if getattr(record, "duration_ms", None) is None:
+            record.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a random ``rate`` fraction of records below ``always_level``.
+
+    Intended for high-volume loggers such as ``django.request`` and
+    ``django.db.backends``; errors are never dropped.
+    """
+
+    def __init__(self, rate: float = 1.0, always_level: int | str = "ERROR"):
+        super().__init__()
+        self.rate = rate
+        if isinstance(always_level, str):
+            always_level = logging.getLevelNamesMapping()[always_level]
+        self.always_level = always_level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.always_level or self.rate >= 1:
+            return True
+        return random.random() < self.rate  # nosec B311
+
+
+class JSONFormatter(logging.Formatter):
+    """Render records as one JSON object per line."""
+
+    context_fields = ("request_id", "user_id", "route", "duration_ms")
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in self.context_fields:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        status_code = getattr(record, "status_code", None)
+        if status_code is not None:
+            payload["status_code"] = status_code
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str)
+
+
+@sync_and_async_middleware
+def request_context_middleware(get_response):
+    """
+    Bind request metadata to log records and emit one access log per request.
+
+    Place it first in ``MIDDLEWARE`` so records logged by every other
+    middleware carry the context; the user id is read when a record is
+    logged, once authentication has run. The request id is taken from
+    ``X-Request-ID`` when present and echoed back on the response.
+    """
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            token = _start_request(request)
+            try:
+                response = await get_response(request)
+                _finish_request(request, response)
+                return response
+            finally:
+                _request_context.reset(token)
+
+    else:
+
+        def middleware(request):
+            token = _start_request(request)
+            try:
+                response = get_response(request)
+                _finish_request(request, response)
+                return response
+            finally:
+                _request_context.reset(token)
+
+    return middleware
+
+
+def _start_request(request):
+    request_id = request.headers.get("X-Request-ID", "")[:64] or uuid.uuid4().hex
+    request.request_id = request_id
+    return _request_context.set((request_id, request, time.perf_counter()))
+
+
+def _finish_request(request, response) -> None:
+    response.setdefault("X-Request-ID", request.request_id)
+    if access_logger.isEnabledFor(logging.INFO):
+        access_logger.info(
+            "%s %s %s",
+            request.method,
+            request.path,
+            response.status_code,
+            extra={"status_code": response.status_code},
+        )
+
+
+def _get_route(request) -> str | None:
+    match = getattr(request, "resolver_match", None)
+    return match.route if match is not None else None
+
+
+def _get_user_id(request):
+    # Never evaluate a lazy ``request.user`` here: doing so would query the
+    # database from inside a logging call (and recurse through the DB logger).
+    user = request.__dict__.get("user")
+    if user is None:
+        return None
+    user = getattr(user, "_wrapped", user)
+    if user is empty or not user.is_authenticated:
+        return None
+    return user.pk
@@ -0,0 +1,229 @@
+"""
+Protected media: uploads that are only served after a permission check.
+
+Files of a ``ProtectedFileField`` are stored under ``PROTECTED_MEDIA_ROOT``,
+which nginx does not expose, and their URLs point to ``serve_protected_media``.
+The view finds the object owning the file and checks the field's permission
+on it, with Django's model permissions or guardian's object permissions.
+{%- if cookiecutter.use_rest_framework == "yes" %} The
+user comes from the session or, for API clients, dj-rest-auth's JWT access
+cookie or ``Authorization`` header.
+{%- endif %}
+
+When ``PROTECTED_MEDIA_X_ACCEL_PREFIX`` is set, the view answers with an
+empty response carrying an ``X-Accel-Redirect`` header, and nginx sends the
+file from an ``internal`` location with ``sendfile``: no file bytes pass
+through Python. Otherwise (development, or no nginx in front) the worker
+streams the file itself with ``FileResponse``.
+"""
+
+import mimetypes
+import posixpath
+from collections.abc import AsyncIterator
+from urllib.parse import quote
+
+from asgiref.sync import sync_to_async
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from dj_rest_auth.jwt_auth import JWTCookieAuthentication
+{%- endif %}
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.core.files.storage import FileSystemStorage
+from django.core.handlers.asgi import ASGIRequest
+from django.db import models
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+from django.utils.http import content_disposition_header
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from rest_framework.exceptions import AuthenticationFailed
+{%- endif %}
+
+
+@deconstructible(path="config.media.ProtectedStorage")
+class ProtectedStorage(FileSystemStorage):
+    """
+    ``FileSystemStorage`` defaulting to ``PROTECTED_MEDIA_ROOT``/``_URL``.
+
+    Like the default storage with ``MEDIA_ROOT``, it follows changes to
+    those settings (e.g. ``override_settings`` in tests).
+    """
+
+    @cached_property
+    def base_location(self):
+        return self._value_or_setting(self._location, settings.PROTECTED_MEDIA_ROOT)
+
+    @cached_property
+    def base_url(self):
+        return self._value_or_setting(
+            self._base_url, f"/{settings.PROTECTED_MEDIA_URL}"
+        )
+
+    def _clear_cached_properties(self, setting, **kwargs):
+        super()._clear_cached_properties(setting, **kwargs)
+        if setting == "PROTECTED_MEDIA_ROOT":
+            self.__dict__.pop("base_location", None)
+            self.__dict__.pop("location", None)
+        elif setting == "PROTECTED_MEDIA_URL":
+            self.__dict__.pop("base_url", None)
+
+
+protected_storage = ProtectedStorage()
+
+
+class ProtectedFileField(models.FileField):
+    """
+    ``FileField`` whose files are served only to users allowed to see them.
+
+    Stored names start with ``<app_label>/<model_name>/<field_name>/`` so
+    the view can find the owning object from the URL alone, and the column
+    is indexed for that lookup. A user may download the file when they have
+    ``<app_label>.<permission>_<model_name>`` (``view`` by default) on the
+    model or, through guardian, on the object itself.
+    """
+
+    def __init__(self, *args, permission: str = "view", **kwargs):
+        self.permission = permission
+        kwargs.setdefault("storage", protected_storage)
+        kwargs.setdefault("db_index", True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.permission != "view":
+            kwargs["permission"] = self.permission
+        if kwargs.get("storage") is protected_storage:
+            del kwargs["storage"]
+        if kwargs.get("db_index"):
+            del kwargs["db_index"]
+        else:
+            kwargs["db_index"] = False
+        return name, path, args, kwargs
+
+    @property
+    def name_prefix(self) -> str:
+        return f"{self.model._meta.app_label}/{self.model._meta.model_name}/{self.name}"
+
+    def generate_filename(self, instance, filename: str) -> str:
+        name = super().generate_filename(instance, filename)
+        return posixpath.join(self.name_prefix, name)
+
+    def get_permission(self) -> str:
+        """Return the permission needed to download this field's files."""
+        opts = self.model._meta
+        return f"{opts.app_label}.{self.permission}_{opts.model_name}"
+
+
+def get_protected_field(name: str) -> ProtectedFileField:
+    """
+    Return the ``ProtectedFileField`` a stored file name belongs to.
+
+    Raises:
+        Http404: The name does not start with a protected field's prefix
+    """
+    try:
+        app_label, model_name, field_name, _ = name.split("/", 3)
+        field = apps.get_model(app_label, model_name)._meta.get_field(field_name)
+    except (ValueError, LookupError, FieldDoesNotExist):
+        raise Http404 from None
+    if not isinstance(field, ProtectedFileField):
+        raise Http404
+    return field
+
+
+# Larger than FileResponse's block size: each chunk costs a thread hop.
+async def _aiter_file(file, chunk_size: int = 2**18) -> AsyncIterator[bytes]:
+    read = sync_to_async(file.read, thread_sensitive=False)
+    while chunk := await read(chunk_size):
+        yield chunk
+
+
+def protected_file_response(
+    request, name: str, storage=protected_storage
+) -> HttpResponse:
+    """
+    Return a response delivering the protected file ``name``.
+
+    Args:
+        request: The current request
+        name: Stored file name, relative to the storage's root
+        storage: Storage holding the file
+
+    Returns:
+        An empty response with ``X-Accel-Redirect`` when
+        ``PROTECTED_MEDIA_X_ACCEL_PREFIX`` is set, else a ``FileResponse``
+        whose body is an async iterator under ASGI (Django would otherwise
+        read a synchronous one whole into memory before sending it)
+    """
+    filename = posixpath.basename(name)
+    prefix = settings.PROTECTED_MEDIA_X_ACCEL_PREFIX
+    if prefix:
+        content_type, _ = mimetypes.guess_type(filename)
+        response = HttpResponse(content_type=content_type or "application/octet-stream")
+        response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(name)
+        response["Content-Disposition"] = content_disposition_header(False, filename)
+        return response
+
+    try:
+        file = storage.open(name)
+    except FileNotFoundError:
+        raise Http404 from None
+    response = FileResponse(file, filename=filename)
+    if isinstance(request, ASGIRequest):
+        response.streaming_content = _aiter_file(file)
+    return response
+
+
+{%- if cookiecutter.use_rest_framework == "yes" %}
+
+
+def get_media_user(request):
+    """
+    Return the session user, or else the user of a JWT access token.
+
+    API clients logged in through dj-rest-auth hold the JWT access cookie
+    (or send an ``Authorization: Bearer`` header) rather than a session,
+    which Django's authentication middleware does not read.
+    """
+    if request.user.is_authenticated:
+        return request.user
+    try:
+        authenticated = JWTCookieAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return request.user
+    return authenticated[0] if authenticated else request.user
+{%- endif %}
+
+
+def serve_protected_media(request, name: str) -> HttpResponse:
+    """
+    Serve a ``ProtectedFileField`` file if the user may view its object.
+
+    Raises:
+        Http404: No object owns a file by that name
+        PermissionDenied: The user lacks the field's permission
+    """
+    field = get_protected_field(name)
+    obj = field.model._default_manager.filter(**{field.attname: name}).first()
+    if obj is None:
+        raise Http404
+
+    permission = field.get_permission()
+{%- if cookiecutter.use_rest_framework == "yes" %}
+    user = get_media_user(request)
+{%- else %}
+    user = request.user
+{%- endif %}
+    if not (user.has_perm(permission) or user.has_perm(permission, obj)):
+        raise PermissionDenied
+
+    response = protected_file_response(request, name, field.storage)
+    patch_cache_control(response, private=True)
+{%- if cookiecutter.use_rest_framework == "yes" %}
+    patch_vary_headers(response, ("Authorization", "Cookie"))
+{%- else %}
+    patch_vary_headers(response, ("Cookie",))
+{%- endif %}
+    return response
@@ -0,0 +1,196 @@
+"""
+Realtime updates pushed to clients over WebSockets (Django Channels).
+
+Clients connect to ``/ws/updates/`` and receive JSON messages published to
+the groups they belong to, instead of polling the REST API. Every
+authenticated connection joins its user's group; clients can ``subscribe``
+to further topics when allowed::
+
+    {"action": "subscribe", "topic": "users"}
+
+Code that changes data calls ``publish()`` with a group and a message; the
+message is sent once the current transaction commits. Messages are small
+change notices (``{"type": "user.updated", "id": 42}``), and clients fetch
+the data they need, so nothing is sent that a user could not read through
+the API.
+
+The channel layer is configured by ``CHANNEL_LAYERS``. The default
+``LocalChannelLayer`` keeps everything in memory, so it only reaches
+connections of the same process.
+"""
+
+import contextlib
+import time
+
+from asgiref.sync import async_to_sync
+from channels.consumer import get_handler_name
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from channels.db import database_sync_to_async
+{%- endif %}
+from channels.exceptions import ChannelFull
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from channels.middleware import BaseMiddleware
+from django.conf import settings
+{%- endif %}
+from django.db import transaction
+from django.urls import path
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+{%- endif %}
+
+USERS_GROUP = "users"
+
+
+class LocalChannelLayer(InMemoryChannelLayer):
+    """
+    Channels' in-memory layer, with a cost per message that does not grow.
+
+    The stock layer sweeps every channel and group membership for expired
+    entries on each ``receive()`` and ``group_send()``. Each socket waits in
+    ``receive()`` and belongs to at least one group, so a message fanned out
+    to N sockets costs O(N²). Here the sweep runs at most once every
+    ``sweep_interval`` seconds, and ``group_send()`` queues messages
+    directly rather than through a task per member.
+
+    This overrides private methods of ``InMemoryChannelLayer``, which is why
+    ``pyproject.toml`` caps channels below the next minor release.
+    """
+
+    sweep_interval = 1.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.next_sweep = 0.0
+
+    def _clean_expired(self):
+        now = time.monotonic()
+        if now >= self.next_sweep:
+            self.next_sweep = now + self.sweep_interval
+            super()._clean_expired()
+
+    async def group_send(self, group, message):
+        assert isinstance(message, dict), "Message is not a dict"
+        self.require_valid_group_name(group)
+        self._clean_expired()
+        for channel in list(self.groups.get(group, ())):
+            with contextlib.suppress(ChannelFull):
+                await self.send(channel, message)
+
+
+def user_group(user_id) -> str:
+    """Return the group of a single user's connections."""
+    return f"user.{user_id}"
+
+
+def publish(group: str, message: dict) -> None:
+    """
+    Send ``message`` to every connection in ``group`` after the commit.
+
+    Args:
+        group: Channel layer group name, e.g. ``user_group(user.pk)``
+        message: JSON-serializable message, with a ``type`` key
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    event = {"type": "publish.message", "message": message}
+    transaction.on_commit(lambda: async_to_sync(channel_layer.group_send)(group, event))
+
+
+class UpdatesConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Forwards published messages to an authenticated client.
+
+    ``topics`` maps the names clients may subscribe to onto a function
+    returning the group for a user, or ``None`` when the user may not
+    subscribe.
+    """
+
+    topics = {
+        "users": lambda user: USERS_GROUP if user.is_staff else None,
+    }
+
+    async def dispatch(self, message):
+        # AsyncConsumer.dispatch() hops to a thread to close stale database
+        # connections before every message; these handlers never query.
+        handler = getattr(self, get_handler_name(message), None)
+        if handler is None:
+            raise ValueError(f"No handler for message type {message['type']}")
+        await handler(message)
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close()
+            return
+        self.subscriptions = set()
+        await self.accept()
+        await self.join(user_group(user.pk))
+
+    async def disconnect(self, code):
+        for group in getattr(self, "subscriptions", ()):
+            await self.channel_layer.group_discard(group, self.channel_name)
+
+    async def join(self, group: str) -> None:
+        await self.channel_layer.group_add(group, self.channel_name)
+        self.subscriptions.add(group)
+
+    async def receive_json(self, content, **kwargs):
+        if not isinstance(content, dict):
+            content = {}
+        action, topic = content.get("action"), content.get("topic")
+        get_group = self.topics.get(topic) if isinstance(topic, str) else None
+        group = get_group(self.scope["user"]) if get_group else None
+
+        if action not in ("subscribe", "unsubscribe") or group is None:
+            await self.send_json({"type": "error", "topic": topic})
+        elif action == "subscribe":
+            await self.join(group)
+            await self.send_json({"type": "subscribed", "topic": topic})
+        else:
+            await self.channel_layer.group_discard(group, self.channel_name)
+            self.subscriptions.discard(group)
+            await self.send_json({"type": "unsubscribed", "topic": topic})
+
+    async def publish_message(self, event):
+        await self.send_json(event["message"])
+{%- if cookiecutter.use_rest_framework == "yes" %}
+
+
+@database_sync_to_async
+def get_jwt_user(raw_token: str):
+    """Return the user of a valid access token, or ``None``."""
+    authentication = JWTAuthentication()
+    try:
+        return authentication.get_user(authentication.get_validated_token(raw_token))
+    except (AuthenticationFailed, TokenError):
+        return None
+
+
+class JWTCookieAuthMiddleware(BaseMiddleware):
+    """
+    Sets ``scope["user"]`` from dj-rest-auth's JWT access cookie.
+
+    Runs inside channels' ``AuthMiddlewareStack``, which parses cookies and
+    provides the session user when no valid token is sent. Browsers send
+    cookies with WebSocket handshakes from any site, so wrap the stack in
+    ``AllowedHostsOriginValidator``.
+    """
+
+    async def __call__(self, scope, receive, send):
+        raw_token = scope.get("cookies", {}).get(settings.REST_AUTH["JWT_AUTH_COOKIE"])
+        if raw_token:
+            user = await get_jwt_user(raw_token)
+            if user is not None:
+                scope = dict(scope, user=user)
+        return await super().__call__(scope, receive, send)
+{%- endif %}
+
+
+websocket_urlpatterns = [
+    path("ws/updates/", UpdatesConsumer.as_asgi()),
+]
@@ -0,0 +1,90 @@
+"""
+orjson-backed renderer for Django REST Framework.
+"""
+
+import math
+from decimal import Decimal
+from itertools import chain, compress, repeat
+from operator import is_
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson writes the line/paragraph separators raw; DRF escapes them so the
+# output is also valid JavaScript.
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+# Values that can never hide a NaN, skipped without inspection.
+JSON_SCALARS = frozenset({str, int, bool, type(None)})
+
+
+def has_non_finite(data) -> bool:
+    """Return whether ``data`` holds a NaN or infinite float or Decimal."""
+    # Walk one nesting level at a time, filtering each level by exact type
+    # with C-level builtins; a per-value Python loop would cost more than the
+    # orjson encode itself.
+    values = [data]
+    while values:
+        types = set(map(type, values)).difference(JSON_SCALARS)
+        if not types:
+            return False
+        nested = []
+        for cls in types:
+            matching = compress(values, map(is_, map(type, values), repeat(cls)))
+            if issubclass(cls, dict):
+                nested.extend(chain.from_iterable(map(dict.values, matching)))
+            elif issubclass(cls, list | tuple):
+                nested.extend(chain.from_iterable(matching))
+            elif issubclass(cls, float):
+                if not all(map(math.isfinite, matching)):
+                    return True
+            elif issubclass(cls, Decimal) and not all(map(Decimal.is_finite, matching)):
+                return True
+        values = nested
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for ``JSONRenderer`` that encodes with orjson.
+
+    Datetimes, dates, times and UUIDs are encoded natively; everything else
+    orjson does not know (``Decimal``, lazy translation strings, timedeltas,
+    querysets, ...) goes through DRF's own ``JSONEncoder.default`` so the
+    output matches the stdlib renderer. Indented output (the browsable API)
+    and payloads orjson rejects (e.g. integers wider than 64 bits) fall back
+    to the stdlib renderer.
+
+    orjson writes NaN and infinity as ``null``. With ``STRICT_JSON`` on (the
+    default), output containing ``null`` is checked for them, and such
+    payloads are handed to the stdlib renderer, which raises ``ValueError``
+    like DRF.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def __init__(self):
+        super().__init__()
+        self.default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.strict and b"null" in ret and has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if LINE_SEPARATOR in ret or PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b"\\u2028")
+            ret = ret.replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+        return ret
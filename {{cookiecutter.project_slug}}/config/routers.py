@@ -0,0 +1,233 @@
+"""
+Read-replica database routing for {{ cookiecutter.project_name }}.
+
+``ReplicaRouter`` sends writes to ``default`` and spreads reads round-robin
+over the aliases in ``settings.DATABASE_REPLICAS``. Reads stay on ``default``
+when the current request has written (or the same client wrote less than
+``DATABASE_REPLICA_MAX_LAG`` seconds ago), inside ``transaction.atomic()``
+and under ``use_primary()``. Replicas that cannot be reached or lag more
+than ``DATABASE_REPLICA_MAX_LAG`` seconds leave the rotation until a later
+health check passes.
+"""
+
+import itertools
+import logging
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.utils.decorators import sync_and_async_middleware
+
+logger = logging.getLogger(__name__)
+
+# Set on responses to requests that wrote, so the client's next requests read
+# from the primary until replicas have caught up.
+PIN_COOKIE = "use_primary_db"
+
+# Replication lag in seconds, by database vendor. Other vendors are only
+# checked for connectivity.
+LAG_QUERIES = {
+    "postgresql": """
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery()
+                OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+    """,
+}
+
+
+class _Pin:
+    """
+    Mutable pinning state of one request or ``use_primary()`` block.
+
+    Mutated in place rather than re-set, so writes made in a thread that
+    ``sync_to_async`` runs with a copied context are still seen.
+    """
+
+    __slots__ = ("pinned", "wrote")
+
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned
+        self.wrote = False
+
+
+_pin: ContextVar[_Pin | None] = ContextVar("replica_pin", default=None)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    Read from ``default`` inside the block.
+
+    Requests are pinned automatically after a write; use this elsewhere
+    (tasks, management commands) when reads must see the latest data.
+    """
+    token = _pin.set(_Pin(pinned=True))
+    try:
+        yield
+    finally:
+        _pin.reset(token)
+
+
+def _read_from_primary() -> bool:
+    state = _pin.get()
+    if state is not None and state.pinned:
+        return True
+    return connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+
+class ReplicaRouter:
+    """
+    Route writes to ``default`` and reads to healthy replicas, round-robin.
+
+    Args:
+        replicas: Database aliases to read from; ``DATABASE_REPLICAS`` if None
+        max_lag: Seconds of lag before a replica leaves the rotation;
+            ``DATABASE_REPLICA_MAX_LAG`` if None
+        check_interval: Minimum seconds between health checks of a replica;
+            ``DATABASE_REPLICA_CHECK_INTERVAL`` if None
+    """
+
+    def __init__(
+        self,
+        replicas: list[str] | None = None,
+        max_lag: float | None = None,
+        check_interval: float | None = None,
+    ):
+        if replicas is None:
+            replicas = settings.DATABASE_REPLICAS
+        self.replicas = list(replicas)
+        self.max_lag = settings.DATABASE_REPLICA_MAX_LAG if max_lag is None else max_lag
+        self.check_interval = (
+            settings.DATABASE_REPLICA_CHECK_INTERVAL
+            if check_interval is None
+            else check_interval
+        )
+        self._cycle = itertools.cycle(self.replicas)
+        self._healthy = dict.fromkeys(self.replicas, True)
+        self._checked_at = dict.fromkeys(self.replicas, -math.inf)
+        self._check_lock = threading.Lock()
+
+    def db_for_read(self, model, **hints) -> str:
+        if _read_from_primary():
+            return DEFAULT_DB_ALIAS
+        for _ in range(len(self.replicas)):
+            alias = next(self._cycle)
+            if self.is_healthy(alias):
+                return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints) -> str:
+        state = _pin.get()
+        if state is not None:
+            state.pinned = state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        return db not in self.replicas
+
+    def is_healthy(self, alias: str) -> bool:
+        """
+        Return the last known health of ``alias``, re-checking it when due.
+
+        Only one thread checks at a time; the others keep using the previous
+        result instead of waiting.
+        """
+        now = time.monotonic()
+        if now - self._checked_at[
+            alias
+        ] >= self.check_interval and self._check_lock.acquire(blocking=False):
+            try:
+                self._checked_at[alias] = now
+                self._set_healthy(alias, self.check(alias))
+            finally:
+                self._check_lock.release()
+        return self._healthy[alias]
+
+    def check(self, alias: str) -> bool:
+        """Return whether ``alias`` is reachable and within ``max_lag``."""
+        try:
+            lag = self.replica_lag(alias)
+        except DatabaseError as exc:
+            logger.warning("Replica %s is unreachable: %s", alias, exc)
+            return False
+        if lag > self.max_lag:
+            logger.warning("Replica %s lags %.1fs behind", alias, lag)
+            return False
+        return True
+
+    def replica_lag(self, alias: str) -> float:
+        """Return the replication lag of ``alias`` in seconds."""
+        connection = connections[alias]
+        with connection.cursor() as cursor:
+            cursor.execute(LAG_QUERIES.get(connection.vendor, "SELECT 0"))
+            return float(cursor.fetchone()[0] or 0)
+
+    def _set_healthy(self, alias: str, healthy: bool) -> None:
+        if healthy != self._healthy[alias]:
+            if healthy:
+                logger.info("Replica %s is back in rotation", alias)
+            else:
+                logger.warning("Replica %s dropped from rotation", alias)
+        self._healthy[alias] = healthy
+
+
+@sync_and_async_middleware
+def replica_pinning_middleware(get_response):
+    """
+    Give each request read-your-writes consistency with ``ReplicaRouter``.
+
+    A request reads from ``default`` once it has written, and so do requests
+    from the same client for ``DATABASE_REPLICA_MAX_LAG`` seconds afterwards
+    (tracked with the ``PIN_COOKIE`` cookie). Place it before the session
+    middleware so session reads are covered too.
+    """
+    max_age = math.ceil(settings.DATABASE_REPLICA_MAX_LAG) or 1
+
+    def start(request):
+        state = _Pin(pinned=PIN_COOKIE in request.COOKIES)
+        return state, _pin.set(state)
+
+    def finish(response, state: _Pin):
+        if state.wrote:
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=max_age,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            state, token = start(request)
+            try:
+                return finish(await get_response(request), state)
+            finally:
+                _pin.reset(token)
+
+    else:
+
+        def middleware(request):
+            state, token = start(request)
+            try:
+                return finish(get_response(request), state)
+            finally:
+                _pin.reset(token)
+
+    return middleware
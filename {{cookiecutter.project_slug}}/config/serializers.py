@@ -0,0 +1,243 @@
+"""
+Read-optimized serializers for Django REST Framework.
+
+``FastReadModelSerializer`` is a ``ModelSerializer`` whose output for plain
+model columns is built from precompiled accessors instead of DRF's
+field-by-field ``get_attribute``/``to_representation`` walk. When it is used
+with ``many=True`` on a queryset, rows are read with ``.values_list()`` so no
+model instances are created at all. Validation and writes are untouched.
+"""
+
+from collections.abc import Callable, Iterable
+from operator import attrgetter
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils.functional import cached_property
+from rest_framework import serializers
+from rest_framework.utils.field_mapping import ClassLookupDict
+
+# Serializer fields whose ``to_representation`` returns database values of the
+# matching model field unchanged, so the call can be skipped.
+IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+    serializers.SlugField,
+    serializers.URLField,
+)
+
+
+class ReadPlan:
+    """
+    Precompiled recipe for rendering one serializer class's readable fields.
+
+    A plan holds only names and indexes, so it can be cached on the class;
+    ``bind()`` attaches the conversions of one serializer instance, whose
+    fields may depend on its context (e.g. ``FileField`` reads the request).
+
+    Attributes:
+        names: Output keys, in serializer field order
+        columns: Model attribute (``attname``) backing each output key
+        converters: ``(index, field_name)`` pairs for values that need
+            converting
+    """
+
+    __slots__ = ("names", "columns", "converters", "getter")
+
+    def __init__(
+        self,
+        names: tuple[str, ...],
+        columns: tuple[str, ...],
+        converters: tuple[tuple[int, str], ...],
+    ):
+        self.names = names
+        self.columns = columns
+        self.converters = converters
+        getter = attrgetter(*columns)
+        self.getter = getter if len(columns) > 1 else lambda obj: (getter(obj),)
+
+    def bind(self, serializer: serializers.Serializer) -> "BoundReadPlan":
+        """Return the plan with ``serializer``'s field conversions."""
+        fields = serializer.fields
+        return BoundReadPlan(
+            self,
+            tuple(
+                (index, fields[name].to_representation)
+                for index, name in self.converters
+            ),
+        )
+
+
+class BoundReadPlan:
+    """
+    ``ReadPlan`` bound to one serializer instance.
+
+    Attributes:
+        converters: ``(index, to_representation)`` pairs for values that need
+            converting; ``None`` values are never converted, as in DRF
+    """
+
+    __slots__ = ("names", "columns", "converters", "_getter")
+
+    def __init__(self, plan: ReadPlan, converters: tuple[tuple[int, Callable], ...]):
+        self.names = plan.names
+        self.columns = plan.columns
+        self.converters = converters
+        self._getter = plan.getter
+
+    def render_row(self, row: tuple) -> dict:
+        """Render one ``values_list()`` row (or attribute tuple) as a dict."""
+        if self.converters:
+            row = list(row)
+            for index, convert in self.converters:
+                value = row[index]
+                if value is not None:
+                    row[index] = convert(value)
+        return dict(zip(self.names, row, strict=True))
+
+    def render_rows(self, rows: Iterable[tuple]) -> list[dict]:
+        """Render ``values_list()`` rows."""
+        names = self.names
+        if not self.converters:
+            return [dict(zip(names, row, strict=True)) for row in rows]
+        render_row = self.render_row
+        return [render_row(row) for row in rows]
+
+    def render_instance(self, instance: models.Model) -> dict:
+        """Render a model instance."""
+        return self.render_row(self._getter(instance))
+
+
+def compile_read_plan(serializer: serializers.ModelSerializer) -> ReadPlan | None:
+    """
+    Build a ``ReadPlan`` for ``serializer``, or ``None`` if it needs DRF.
+
+    Only fields backed by a single concrete model column qualify: plain
+    columns and primary-key foreign keys. Nested serializers, method fields,
+    dotted sources, properties and other related fields disable the plan
+    for the whole serializer.
+    """
+    opts = serializer.Meta.model._meta
+    field_mapping = ClassLookupDict(serializer.serializer_field_mapping)
+    names, columns, converters = [], [], []
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if len(field.source_attrs) != 1:
+            return None
+        try:
+            model_field = opts.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+
+        if model_field.is_relation:
+            if (
+                type(field) is not serializers.PrimaryKeyRelatedField
+                or field.pk_field is not None
+            ):
+                return None
+        elif isinstance(field, serializers.BaseSerializer):
+            return None
+        elif not _is_identity(field, model_field, field_mapping):
+            converters.append((len(names), name))
+
+        names.append(name)
+        columns.append(model_field.attname)
+
+    if not names:
+        return None
+    return ReadPlan(tuple(names), tuple(columns), tuple(converters))
+
+
+def _is_identity(field, model_field, field_mapping: ClassLookupDict) -> bool:
+    # Only trust the default mapping: ``CharField`` declared over an integer
+    # column, for instance, still has to convert.
+    try:
+        default_class = field_mapping[model_field]
+    except KeyError:
+        return False
+    return type(field) is default_class and default_class in IDENTITY_FIELDS
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """
+    ``ListSerializer`` that renders querysets from ``values_list()`` rows.
+
+    Accepts a queryset, a manager, a list of rows produced by
+    ``FastReadModelSerializer.values_list()`` (e.g. a paginated page) or a
+    list of instances.
+    """
+
+    def to_representation(self, data):
+        plan = self.child.read_plan
+        if plan is None:
+            return super().to_representation(data)
+
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        if isinstance(data, models.QuerySet):
+            return plan.render_rows(data.values_list(*plan.columns))
+
+        items = data if isinstance(data, list | tuple) else list(data)
+        if items and isinstance(items[0], tuple):
+            return plan.render_rows(items)
+        render_instance = plan.render_instance
+        return [render_instance(item) for item in items]
+
+
+class FastReadModelSerializer(serializers.ModelSerializer):
+    """
+    ``ModelSerializer`` with a precompiled read path.
+
+    The plan is compiled once per serializer class from its fields and bound
+    to each instance's own fields, so conversions see that instance's
+    context. Set ``fast_read = False`` on subclasses whose set of fields
+    changes per instance or per request (e.g. fields chosen from the request
+    context).
+    """
+
+    fast_read = True
+    _read_plan = None
+    _read_plan_compiled = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._read_plan = None
+        cls._read_plan_compiled = False
+        meta = getattr(cls, "Meta", None)
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = ValuesListSerializer
+
+    @classmethod
+    def get_read_plan(cls, serializer) -> ReadPlan | None:
+        """Return the class's unbound plan, compiling it from ``serializer``."""
+        if not cls.fast_read:
+            return None
+        if not cls._read_plan_compiled:
+            cls._read_plan = compile_read_plan(serializer)
+            cls._read_plan_compiled = True
+        return cls._read_plan
+
+    @cached_property
+    def read_plan(self) -> BoundReadPlan | None:
+        plan = self.get_read_plan(self)
+        return plan.bind(self) if plan is not None else None
+
+    def values_list(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Return ``queryset`` reduced to the columns the read plan needs."""
+        plan = self.get_read_plan(self)
+        if plan is None:
+            return queryset
+        return queryset.values_list(*plan.columns)
+
+    def to_representation(self, instance):
+        plan = self.read_plan
+        if plan is None or not isinstance(instance, models.Model):
+            return super().to_representation(instance)
+        return plan.render_instance(instance)
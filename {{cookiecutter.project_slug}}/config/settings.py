@@ -54,6 +54,7 @@ THIRD_PARTY_APPS = [
     "rest_framework",
     "rest_framework.authtoken",
     "rest_framework_simplejwt",
+    "rest_framework_simplejwt.token_blacklist",
     "dj_rest_auth",
     "drf_yasg",
 {%- endif %}
@@ -64,16 +65,22 @@ THIRD_PARTY_APPS = [
 ]
 
 LOCAL_APPS = [
+    "profiling",
 {%- if cookiecutter.include_accounts_app == "yes" %}
     "accounts",
 {%- endif %}
+{%- if cookiecutter.use_huey == "yes" %}
+    "housekeeping",
+{%- endif %}
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    "config.log.request_context_middleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "config.middleware.JSONGZipMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
 {%- if cookiecutter.use_rest_framework == "yes" %}
     "corsheaders.middleware.CorsMiddleware",
@@ -81,10 +88,14 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "profiling.middleware.profiling_middleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# JSON responses smaller than this are sent uncompressed.
+GZIP_MIN_LENGTH = config("GZIP_MIN_LENGTH", default=1024, cast=int)
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -111,13 +122,90 @@ if IS_TESTING:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": ":memory:",
-        }
+        },
+        # Stand-in read replica for the config.routers tests; only created for
+        # tests that ask for it.
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+        },
     }
 else:
     DATABASES = {"default": dj_database_url.parse(config("DATABASE_URL"))}
     if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
         DATABASES["default"]["NAME"] = BASE_DIR / "data" / "db.sqlite3"
 
+# Read replicas
+# Each URL in DATABASE_REPLICA_URLS becomes a replica_<n> alias. With at least
+# one replica, config.routers.ReplicaRouter reads from them round-robin and
+# writes to default; a request reads from default once it has written.
+# Replicas lagging more than DATABASE_REPLICA_MAX_LAG seconds, or unreachable,
+# are skipped until a later check (every DATABASE_REPLICA_CHECK_INTERVAL s).
+# The check runs on a request thread, so PostgreSQL replicas give up connecting
+# after DATABASE_REPLICA_CONNECT_TIMEOUT seconds instead of the OS TCP timeout.
+DATABASE_REPLICAS = []
+DATABASE_REPLICA_MAX_LAG = config("DATABASE_REPLICA_MAX_LAG", default=5.0, cast=float)
+DATABASE_REPLICA_CHECK_INTERVAL = config(
+    "DATABASE_REPLICA_CHECK_INTERVAL", default=5.0, cast=float
+)
+DATABASE_REPLICA_CONNECT_TIMEOUT = config(
+    "DATABASE_REPLICA_CONNECT_TIMEOUT", default=3, cast=int
+)
+if not IS_TESTING:
+    for index, url in enumerate(
+        config("DATABASE_REPLICA_URLS", default="", cast=Csv()), start=1
+    ):
+        replica = dj_database_url.parse(url)
+        if replica["ENGINE"] == "django.db.backends.postgresql":
+            replica.setdefault("OPTIONS", {}).setdefault(
+                "connect_timeout", DATABASE_REPLICA_CONNECT_TIMEOUT
+            )
+        DATABASES[f"replica_{index}"] = replica
+        DATABASE_REPLICAS.append(f"replica_{index}")
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["config.routers.ReplicaRouter"]
+    MIDDLEWARE.insert(
+        MIDDLEWARE.index("django.contrib.sessions.middleware.SessionMiddleware"),
+        "config.routers.replica_pinning_middleware",
+    )
+
+# Cache
+# LocMemCache is per-process; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# cache (e.g. FileBasedCache, Memcached, Redis) when running several processes.
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="{{ cookiecutter.project_slug }}"),
+    }
+}
+
+{%- if cookiecutter.use_websockets == "yes" %}
+
+# Channel layer for config.realtime. The default in-memory layer only reaches
+# sockets of the same process; with several daphne processes or hosts, set
+# CHANNEL_LAYER_BACKEND to a shared layer (e.g.
+# channels_redis.core.RedisChannelLayer) and CHANNEL_LAYER_HOSTS.
+CHANNEL_LAYERS = {
+    "default": {
+        "BACKEND": config(
+            "CHANNEL_LAYER_BACKEND", default="config.realtime.LocalChannelLayer"
+        ),
+        "CONFIG": {
+            "capacity": config("CHANNEL_LAYER_CAPACITY", default=100, cast=int),
+        },
+    }
+}
+if CHANNEL_LAYER_HOSTS := config("CHANNEL_LAYER_HOSTS", default="", cast=Csv()):
+    CHANNEL_LAYERS["default"]["CONFIG"]["hosts"] = CHANNEL_LAYER_HOSTS
+{%- endif %}
+
+# Sessions
+# Engines: db, cached_db (DB with cache in front), cache (no DB writes, sessions
+# are lost when the cache is cleared), signed_cookies (no server-side storage).
+SESSION_ENGINE = "django.contrib.sessions.backends.{{ cookiecutter.session_backend }}"
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -155,6 +243,14 @@ USE_TZ = True
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATIC_URL = "static/"
 MEDIA_URL = "media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
+# Protected media (config.media.ProtectedFileField) is served by
+# config.media.serve_protected_media after a permission check. Behind nginx,
+# set the prefix of its internal location to hand delivery over to it.
+PROTECTED_MEDIA_URL = "protected-media/"
+PROTECTED_MEDIA_ROOT = BASE_DIR / "protected_media"
+PROTECTED_MEDIA_X_ACCEL_PREFIX = config("PROTECTED_MEDIA_X_ACCEL_PREFIX", default="")
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -163,6 +259,72 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "accounts.User"
 {%- endif %}
 
+# Logging
+# Records are queued by the request thread and written by a background
+# listener thread, so request paths never block on log I/O.
+LOG_LEVEL = config("LOG_LEVEL", default="INFO")
+
+LOGGING_CONFIG = "config.log.configure_logging"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "filters": {
+        "request_context": {"()": "config.log.RequestContextFilter"},
+        "sample_django_request": {
+            "()": "config.log.SamplingFilter",
+            "rate": config("LOG_SAMPLE_RATE_DJANGO_REQUEST", default=1.0, cast=float),
+        },
+        "sample_django_db": {
+            "()": "config.log.SamplingFilter",
+            "rate": config("LOG_SAMPLE_RATE_DJANGO_DB", default=1.0, cast=float),
+        },
+    },
+    "formatters": {
+        "json": {"()": "config.log.JSONFormatter"},
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "json",
+        },
+        "queue": {
+            "class": "config.log.NonBlockingQueueHandler",
+            "handlers": ["console"],
+            "filters": ["request_context"],
+            "respect_handler_level": True,
+        },
+    },
+    "root": {
+        "handlers": ["queue"],
+        "level": LOG_LEVEL,
+    },
+    "loggers": {
+        "django": {
+            "handlers": ["queue"],
+            "level": LOG_LEVEL,
+            "propagate": False,
+        },
+        "django.request": {
+            "filters": ["sample_django_request"],
+        },
+        "django.db.backends": {
+            "level": config("LOG_LEVEL_DJANGO_DB", default="INFO"),
+            "filters": ["sample_django_db"],
+        },
+    },
+}
+
+# Profiling
+# Staff users (?_profile) or holders of a signed X-Profile header
+# (manage.py profile_token) can profile single requests; reports are listed
+# at /admin/profiles/. The oldest reports are deleted beyond either limit.
+PROFILING_ENABLED = config("PROFILING_ENABLED", default=True, cast=bool)
+PROFILING_DIR = BASE_DIR / "data" / "profiles"
+PROFILING_MAX_REPORTS = config("PROFILING_MAX_REPORTS", default=100, cast=int)
+PROFILING_MAX_SIZE_MB = config("PROFILING_MAX_SIZE_MB", default=50, cast=int)
+PROFILING_TOKEN_MAX_AGE = config("PROFILING_TOKEN_MAX_AGE", default=3600, cast=int)
+
 # Email Configuration
 EMAIL_BACKEND = config("EMAIL_BACKEND")
 EMAIL_HOST = config("EMAIL_HOST")
@@ -190,11 +352,37 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "dj_rest_auth.jwt_auth.JWTCookieAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "config.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
     "DEFAULT_VERSION": "v1",
     "ALLOWED_VERSIONS": ["v1", "v2"],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # Token buckets in the default cache; see config/throttling.py. The login
+    # view adds the "login" (per IP) and "login_account" (per email) rates.
+    "DEFAULT_THROTTLE_CLASSES": (
+        "config.throttling.AnonRateThrottle",
+        "config.throttling.UserRateThrottle",
+        "config.throttling.ScopedRateThrottle",
+    ),
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": config("THROTTLE_RATE_ANON", default="100/min"),
+        "user": config("THROTTLE_RATE_USER", default="1000/min"),
+        "dj_rest_auth": config("THROTTLE_RATE_AUTH", default="60/min"),
+        "login": config("THROTTLE_RATE_LOGIN", default="10/min"),
+        "login_account": config("THROTTLE_RATE_LOGIN_ACCOUNT", default="5/min"),
+    },
+    # Reverse proxies in front of the app; client IPs are taken from
+    # X-Forwarded-For only when this is set.
+    "NUM_PROXIES": config("NUM_PROXIES", default=0, cast=int),
 }
 
 SIMPLE_JWT = {
@@ -206,8 +394,10 @@ REST_AUTH = {
     "JWT_AUTH_COOKIE": "access",
     "JWT_AUTH_REFRESH_COOKIE": "refresh",
     "JWT_AUTH_HTTPONLY": False,
+{%- if cookiecutter.include_accounts_app == "yes" %}
     "LOGIN_SERIALIZER": "accounts.serializers.LoginSerializer",
     "USER_DETAILS_SERIALIZER": "accounts.serializers.UserDetailsSerializer",
+{%- endif %}
     "JWT_AUTH_SAMESITE": config("JWT_AUTH_SAMESITE", default="Lax"),
     "JWT_AUTH_SECURE": config("JWT_AUTH_SECURE", default=False, cast=bool),
 }
@@ -228,4 +418,14 @@ HUEY = {
         "worker_type": "thread",
     },
 }
+
+# Housekeeping: periodic tasks delete expired rows in batches of
+# HOUSEKEEPING_BATCH_SIZE, one short transaction each, and start no new batch
+# after HOUSEKEEPING_TIME_BUDGET seconds. Unread task results beyond the newest
+# HOUSEKEEPING_HUEY_RESULTS_KEEP are deleted.
+HOUSEKEEPING_BATCH_SIZE = config("HOUSEKEEPING_BATCH_SIZE", default=1000, cast=int)
+HOUSEKEEPING_TIME_BUDGET = config("HOUSEKEEPING_TIME_BUDGET", default=30, cast=float)
+HOUSEKEEPING_HUEY_RESULTS_KEEP = config(
+    "HOUSEKEEPING_HUEY_RESULTS_KEEP", default=1000, cast=int
+)
 {%- endif %}
@@ -0,0 +1,141 @@
+"""
+Cache-backed token-bucket throttles for Django REST Framework.
+
+Each client may send ``num_requests`` requests at once, from a DRF rate such
+as ``"100/min"``; its allowance then refills at one request every
+``duration / num_requests`` seconds, so no window boundary lets a second
+burst through. The bucket is stored as one timestamp per client, the
+theoretical arrival time of the generic cell rate algorithm (GCRA): each
+allowed request moves it ``duration / num_requests`` later, and a request is
+refused if that would put it more than ``duration`` ahead of now. DRF's own
+throttles instead read, trim and rewrite a list of request timestamps on
+every request, so their cost grows with the rate.
+
+With Django's Redis cache, the check and update are one Lua script: a single
+atomic round-trip. With the local-memory cache they run under a process-wide
+lock. Other caches (Memcached, database, files) read and write the timestamp
+with a ``get()`` and a ``set()``, so concurrent requests of one client on
+different processes can occasionally both pass; use Redis where the limits
+must hold exactly across processes.
+"""
+
+import hashlib
+import math
+import threading
+from contextlib import nullcontext
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.utils.functional import cached_property
+from rest_framework import throttling
+
+# KEYS[1] is the bucket; ARGV holds now, the interval between requests and
+# the duration, in seconds. Returns the seconds to wait, "0" if allowed.
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local duration = tonumber(ARGV[3])
+local tat = math.max(tonumber(redis.call("GET", KEYS[1]) or now), now)
+tat = tat + interval
+if tat - now > duration then
+    return tostring(tat - now - duration)
+end
+redis.call("SET", KEYS[1], tostring(tat), "PX", math.ceil((tat - now) * 1000))
+return "0"
+"""
+
+_local_lock = threading.Lock()
+
+
+class TokenBucketThrottle(throttling.SimpleRateThrottle):
+    """
+    ``SimpleRateThrottle`` keeping one GCRA timestamp per client.
+
+    Subclasses set ``scope`` (or ``rate``) and implement ``get_cache_key``
+    exactly as for DRF's throttles.
+    """
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.wait_seconds = self.take_token(self.timer())
+        return self.wait_seconds == 0
+
+    @cached_property
+    def backend(self):
+        # DRF's default is the ``django.core.cache.cache`` proxy; resolve it so
+        # the backend's type can be checked.
+        return caches[DEFAULT_CACHE_ALIAS] if self.cache is cache else self.cache
+
+    def take_token(self, now: float) -> float:
+        """Take one request from the bucket; return the seconds to wait, or 0."""
+        interval = self.duration / self.num_requests
+        if isinstance(self.backend, RedisCache):
+            return self.take_token_redis(now, interval)
+
+        local = isinstance(self.backend, LocMemCache)
+        with _local_lock if local else nullcontext():
+            tat = max(self.cache.get(self.key, now), now) + interval
+            if tat - now > self.duration:
+                return tat - now - self.duration
+            self.cache.set(self.key, tat, math.ceil(tat - now))
+        return 0
+
+    def take_token_redis(self, now: float, interval: float) -> float:
+        key = self.backend.make_and_validate_key(self.key)
+        client = self.backend._cache.get_client(key, write=True)
+        return float(client.eval(GCRA_SCRIPT, 1, key, now, interval, self.duration))
+
+    def wait(self) -> float:
+        return self.wait_seconds
+
+
+class AnonRateThrottle(throttling.AnonRateThrottle, TokenBucketThrottle):
+    """Limits unauthenticated requests per client IP (``anon`` rate)."""
+
+
+class UserRateThrottle(throttling.UserRateThrottle, TokenBucketThrottle):
+    """Limits requests per user, or per IP when anonymous (``user`` rate)."""
+
+
+class ScopedRateThrottle(throttling.ScopedRateThrottle, TokenBucketThrottle):
+    """Limits requests per user or IP to views with a ``throttle_scope``."""
+
+
+class LoginRateThrottle(TokenBucketThrottle):
+    """Limits login attempts per client IP (``login`` rate)."""
+
+    scope = "login"
+
+    def get_cache_key(self, request, view) -> str:
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class LoginAccountRateThrottle(TokenBucketThrottle):
+    """
+    Limits login attempts per account, whichever IPs they come from.
+
+    Uses the ``login_account`` rate. The submitted email or username is
+    hashed into the key, so the cache never holds it in clear.
+    """
+
+    scope = "login_account"
+
+    def get_cache_key(self, request, view) -> str | None:
+        data = request.data
+        if not hasattr(data, "get"):
+            return None
+        account = data.get("email") or data.get("username")
+        if not isinstance(account, str) or not account.strip():
+            return None
+        digest = hashlib.sha256(account.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": digest}
@@ -15,23 +15,38 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.http import HttpResponse
-from django.urls import path
+from django.urls import include, path
+
+from config.media import serve_protected_media
 
 def health_check(request):
     return HttpResponse("OK")
 
 urlpatterns = [
+    path("admin/profiles/", include("profiling.urls")),
     path("admin/", admin.site.urls),
     path("health/", health_check),
+    path(
+        f"{settings.PROTECTED_MEDIA_URL}<path:name>",
+        serve_protected_media,
+        name="protected_media",
+    ),
 ]
 
 {%- if cookiecutter.use_rest_framework == "yes" %}
 from rest_framework import permissions
+from rest_framework.settings import api_settings
+from dj_rest_auth.views import LoginView
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
-from django.urls import include
+
+from config.throttling import LoginAccountRateThrottle, LoginRateThrottle
+{%- if cookiecutter.include_accounts_app == "yes" %}
+from accounts.views import UserDetailsView
+{%- endif %}
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -44,7 +59,25 @@ schema_view = get_schema_view(
 )
 
 urlpatterns += [
+    # Login also limited per client IP and per account, ahead of password hashing.
+    path(
+        "api/auth/login/",
+        LoginView.as_view(
+            throttle_classes=[
+                *api_settings.DEFAULT_THROTTLE_CLASSES,
+                LoginRateThrottle,
+                LoginAccountRateThrottle,
+            ]
+        ),
+        name="rest_login",
+    ),
+{%- if cookiecutter.include_accounts_app == "yes" %}
+    path("api/auth/user/", UserDetailsView.as_view(), name="rest_user_details"),
+{%- endif %}
     path("api/auth/", include("dj_rest_auth.urls")),
+{%- if cookiecutter.include_accounts_app == "yes" %}
+    path("api/users/", include("accounts.urls")),
+{%- endif %}
     path("api/swagger<format>/", schema_view.without_ui(cache_timeout=0), name='schema-json'),
     path("api/swagger/", schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path("api/redoc/", schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
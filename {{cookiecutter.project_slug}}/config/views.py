@@ -0,0 +1,106 @@
+"""
+Reusable view mixins for the REST API.
+"""
+
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+    quote_etag,
+)
+from django.utils.http import http_date
+from rest_framework import mixins
+
+
+class FastListModelMixin(mixins.ListModelMixin):
+    """
+    List mixin that paginates ``values_list()`` rows instead of instances.
+
+    Use with a ``config.serializers.FastReadModelSerializer``: the page is
+    fetched with only the columns the serializer renders and no model
+    instances are built. Serializers without a read plan behave as usual.
+    """
+
+    def paginate_queryset(self, queryset):
+        serializer = self.get_serializer()
+        if hasattr(serializer, "values_list"):
+            queryset = serializer.values_list(queryset)
+        return super().paginate_queryset(queryset)
+
+
+class ConditionalGetMixin:
+    """
+    Answer conditional GETs from cheap validators, before serialization.
+
+    ``get_validators()`` runs after authentication, permission and throttle
+    checks. The ETag is a digest of those validators plus the user, the full
+    path and the negotiated format, so it never requires rendering or hashing
+    the body. When ``If-None-Match`` matches, the view returns 304 without
+    running its queryset or serializer.
+
+    ``Last-Modified`` (and ``If-Modified-Since``) are only used when the
+    timestamp is the sole validator: with one-second resolution and no way to
+    reflect deletes, they would answer 304 for changes the ETag catches.
+
+    Responses are marked ``Cache-Control: private, no-cache`` so clients
+    store them but revalidate on every use.
+    """
+
+    last_modified_field = "updated_at"
+
+    def get_validators(self, request) -> tuple[datetime | None, tuple]:
+        """
+        Return when the response's data last changed, and other inputs.
+
+        The default suits list views: one aggregate over the filtered queryset
+        for the newest ``last_modified_field`` and the row count, which changes
+        on deletes. ``QuerySet.update()`` skips ``auto_now``, so bulk updates
+        must set that field themselves to be seen.
+
+        Returns:
+            ``(last_modified, extra)``: the newest ``updated_at``-style
+            timestamp (or ``None``) and a tuple of other values the response
+            depends on
+        """
+        stats = self.filter_queryset(self.get_queryset()).aggregate(
+            last_modified=Max(self.last_modified_field), count=Count("pk")
+        )
+        return stats["last_modified"], (stats["count"],)
+
+    def get(self, request, *args, **kwargs):
+        last_modified, extra = self.get_validators(request)
+        timestamp = None
+        if last_modified and not extra:
+            timestamp = int(last_modified.timestamp())
+        etag = self.make_etag(request, last_modified, extra)
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        ) or super().get(request, *args, **kwargs)
+
+        if 200 <= response.status_code < 300 or response.status_code == 304:
+            response.headers.setdefault("ETag", etag)
+            if timestamp is not None:
+                response.headers.setdefault("Last-Modified", http_date(timestamp))
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Authorization", "Cookie"))
+        return response
+
+    def make_etag(self, request, last_modified: datetime | None, extra: tuple) -> str:
+        """Return a quoted ETag for the validators of this request."""
+        user = getattr(request, "user", None)
+        renderer = getattr(request, "accepted_renderer", None)
+        parts = (
+            type(self).__qualname__,
+            getattr(user, "pk", None),
+            request.get_full_path(),
+            getattr(renderer, "format", None),
+            last_modified.isoformat() if last_modified else None,
+            *extra,
+        )
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+        return quote_etag(digest)
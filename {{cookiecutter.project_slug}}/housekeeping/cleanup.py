@@ -0,0 +1,113 @@
+"""
+Batched deletion helpers for housekeeping tasks.
+"""
+
+import time
+
+from django.db import transaction
+from django.db.models import QuerySet
+from huey import Huey
+from huey.storage import SqliteStorage
+
+DEFAULT_BATCH_SIZE = 1000
+# Huey stores revocations of single tasks ("r:<id>") and of whole task
+# classes, including periodic tasks ("rt:<module.task>"), and task locks
+# ("<name>.lock.<lock>") next to results in its key-value table; those must
+# survive trimming.
+HUEY_RESULT_KEYS = (
+    "queue = ? AND key NOT LIKE 'r:%' AND key NOT LIKE 'rt:%' "
+    "AND key NOT LIKE '%.lock.%'"
+)
+
+
+def _deadline(time_budget: float | None) -> float:
+    return float("inf") if time_budget is None else time.monotonic() + time_budget
+
+
+def delete_in_batches(
+    queryset: QuerySet,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    time_budget: float | None = None,
+) -> int:
+    """
+    Delete the rows matched by ``queryset`` a batch at a time.
+
+    Each batch selects at most ``batch_size`` primary keys and deletes them in
+    its own short transaction, so the table is never locked for long and
+    concurrent requests keep making progress.
+
+    Args:
+        queryset: Rows to delete; should filter on an indexed column
+        batch_size: Maximum number of rows deleted per statement
+        time_budget: Seconds after which no new batch is started, leaving the
+            remaining rows for the next run; ``None`` deletes them all
+
+    Returns:
+        The total number of rows deleted
+    """
+    model = queryset.model
+    deadline = _deadline(time_budget)
+    total = 0
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return total
+        with transaction.atomic(using=queryset.db):
+            deleted, _ = (
+                model._base_manager.using(queryset.db).filter(pk__in=pks).delete()
+            )
+        total += deleted
+        if len(pks) < batch_size or time.monotonic() >= deadline:
+            return total
+
+
+def trim_huey_results(
+    huey: Huey,
+    keep: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    time_budget: float | None = None,
+) -> int:
+    """
+    Delete the oldest stored task results beyond the newest ``keep``.
+
+    Huey keeps a task's return value until it is read, so results of tasks
+    nobody waits on accumulate. They carry no timestamp, but SQLite's rowid
+    follows insertion order, so the oldest go first, a batch per transaction.
+
+    Args:
+        huey: Huey instance using ``SqliteStorage`` (``huey.SqliteHuey``)
+        keep: Number of most recent results to keep
+        batch_size: Maximum number of results deleted per statement
+        time_budget: Seconds after which no new batch is started
+
+    Returns:
+        The number of results deleted
+
+    Raises:
+        TypeError: The storage is not ``SqliteStorage``
+    """
+    storage = huey.storage
+    if not isinstance(storage, SqliteStorage):
+        raise TypeError(f"Cannot trim results of {type(storage).__name__}")
+
+    ((excess,),) = storage.sql(
+        f"SELECT count(*) - ? FROM kv WHERE {HUEY_RESULT_KEYS}",
+        (keep, storage.name),
+        results=True,
+    )
+    deadline = _deadline(time_budget)
+    total = 0
+    while excess > 0:
+        with storage.db(commit=True) as cursor:
+            cursor.execute(
+                "DELETE FROM kv WHERE rowid IN ("
+                f"SELECT rowid FROM kv WHERE {HUEY_RESULT_KEYS} ORDER BY rowid LIMIT ?"
+                ")",
+                (storage.name, min(batch_size, excess)),
+            )
+            deleted = cursor.rowcount
+        total += deleted
+        excess -= deleted
+        if not deleted or time.monotonic() >= deadline:
+            break
+    return total
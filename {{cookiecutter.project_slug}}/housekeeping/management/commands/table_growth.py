@@ -0,0 +1,149 @@
+"""
+Report table sizes and how much each table grew since the previous report.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.utils import timezone
+from huey.contrib.djhuey import HUEY
+
+# Pseudo-table for the task results Huey keeps in its own database.
+HUEY_RESULTS = "(huey results)"
+
+
+def table_stats(connection) -> dict[str, dict[str, int | None]]:
+    """
+    Return the row count and size in bytes (``None`` if unknown) of each table.
+
+    PostgreSQL row counts are the planner's estimates, which avoid scanning
+    large tables; tables never analyzed are counted exactly.
+    """
+    stats = {}
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT c.relname, c.reltuples::bigint, pg_total_relation_size(c.oid) "
+                "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relkind IN ('r', 'p') AND n.nspname = current_schema()"
+            )
+            stats = {
+                name: {"rows": rows if rows >= 0 else None, "bytes": size}
+                for name, rows, size in cursor.fetchall()
+            }
+        else:
+            sizes = {}
+            if connection.vendor == "sqlite":
+                try:
+                    cursor.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+                    sizes = dict(cursor.fetchall())
+                except DatabaseError:  # SQLite built without dbstat
+                    pass
+            stats = {
+                name: {"rows": None, "bytes": sizes.get(name)}
+                for name in connection.introspection.table_names(cursor)
+            }
+        for name, table in stats.items():
+            if table["rows"] is None:
+                cursor.execute(
+                    f"SELECT COUNT(*) FROM {connection.ops.quote_name(name)}"
+                )
+                table["rows"] = cursor.fetchone()[0]
+    return stats
+
+
+def format_bytes(size: int | None) -> str:
+    if size is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            break
+        size /= 1024
+    return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Print row counts and sizes of the largest tables and their growth "
+        "since the previous run, then save this run as the new snapshot."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database to report on (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of tables shown, fastest-growing first; 0 shows all.",
+        )
+        parser.add_argument(
+            "--snapshot",
+            default=settings.BASE_DIR / "data" / "table_growth.json",
+            help="File holding the previous run (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--no-save",
+            action="store_true",
+            help="Compare with the snapshot without replacing it.",
+        )
+
+    def handle(self, *args, **options):
+        tables = table_stats(connections[options["database"]])
+        tables[HUEY_RESULTS] = {"rows": HUEY.result_count(), "bytes": None}
+        now = timezone.now()
+
+        snapshot_path = Path(options["snapshot"])
+        try:
+            with open(snapshot_path) as f:
+                previous = json.load(f)
+        except FileNotFoundError:
+            previous = None
+        if previous and previous.get("database") != options["database"]:
+            previous = None
+        before = previous["tables"] if previous else {}
+
+        def growth(name: str) -> int:
+            return tables[name]["rows"] - before.get(name, {}).get("rows", 0)
+
+        names = sorted(
+            tables, key=lambda n: (growth(n), tables[n]["rows"]), reverse=True
+        )
+        if options["limit"]:
+            names = names[: options["limit"]]
+
+        width = max(len(name) for name in names)
+        self.stdout.write(
+            f"{'Table':<{width}}  {'Rows':>12}  {'Change':>10}  {'Size':>9}"
+        )
+        for name in names:
+            change = f"{growth(name):+,}" if name in before else "new" if before else ""
+            self.stdout.write(
+                f"{name:<{width}}  {tables[name]['rows']:>12,}  {change:>10}  "
+                f"{format_bytes(tables[name]['bytes']):>9}"
+            )
+
+        if previous:
+            since = datetime.fromisoformat(previous["created"])
+            days = (now - since).total_seconds() / 86400
+            self.stdout.write(
+                f"\nChange since {since:%Y-%m-%d %H:%M} ({days:.1f} days ago)"
+            )
+        else:
+            self.stdout.write("\nNo previous snapshot; run again later to see growth.")
+
+        if not options["no_save"]:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            snapshot = {
+                "created": now.isoformat(),
+                "database": options["database"],
+                "tables": tables,
+            }
+            snapshot_path.write_text(json.dumps(snapshot, indent=2))
@@ -0,0 +1,89 @@
+"""
+Periodic Huey tasks that keep housekeeping tables from growing unbounded.
+
+Every run deletes in batches of ``HOUSEKEEPING_BATCH_SIZE`` rows, each in its
+own short transaction, and starts no new batch after
+``HOUSEKEEPING_TIME_BUDGET`` seconds; the rest is left for the next run.
+"""
+
+import logging
+
+from django.conf import settings
+{%- if cookiecutter.session_backend in ["db", "cached_db"] %}
+from django.contrib.sessions.models import Session
+{%- endif %}
+{%- if cookiecutter.session_backend in ["db", "cached_db"] or cookiecutter.use_rest_framework == "yes" %}
+from django.utils import timezone
+{%- endif %}
+from huey import crontab
+{%- if cookiecutter.session_backend in ["db", "cached_db"] or cookiecutter.use_rest_framework == "yes" %}
+from huey.contrib.djhuey import HUEY, db_periodic_task, periodic_task
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+{%- endif %}
+
+from .cleanup import delete_in_batches, trim_huey_results
+{%- else %}
+from huey.contrib.djhuey import HUEY, periodic_task
+
+from .cleanup import trim_huey_results
+{%- endif %}
+
+logger = logging.getLogger(__name__)
+
+
+def budget() -> dict[str, float]:
+    """Batch size and time budget from settings, as cleanup keyword arguments."""
+    return {
+        "batch_size": settings.HOUSEKEEPING_BATCH_SIZE,
+        "time_budget": settings.HOUSEKEEPING_TIME_BUDGET,
+    }
+{%- if cookiecutter.session_backend in ["db", "cached_db"] %}
+
+
+@db_periodic_task(crontab(minute="15"))
+def clear_expired_sessions() -> int:
+    """
+    Delete expired ``django_session`` rows in batches, once an hour.
+
+    Replaces running ``manage.py clearsessions`` from cron, which deletes
+    every expired row in a single statement.
+    """
+    deleted = delete_in_batches(
+        Session.objects.filter(expire_date__lt=timezone.now()), **budget()
+    )
+    logger.info("Cleared %s expired sessions", deleted)
+    return deleted
+{%- endif %}
+{%- if cookiecutter.use_rest_framework == "yes" %}
+
+
+@db_periodic_task(crontab(minute="25"))
+def clear_expired_tokens() -> int:
+    """
+    Delete expired JWT refresh tokens in batches, once an hour.
+
+    simplejwt's ``token_blacklist`` app records every refresh token it issues
+    and those revoked on logout; blacklist entries go with their outstanding
+    token. Replaces ``flushexpiredtokens``.
+    """
+    deleted = delete_in_batches(
+        OutstandingToken.objects.filter(expires_at__lt=timezone.now()), **budget()
+    )
+    logger.info("Cleared %s expired refresh token and blacklist rows", deleted)
+    return deleted
+{%- endif %}
+
+
+@periodic_task(crontab(minute="35"))
+def trim_task_results() -> int:
+    """
+    Delete unread Huey task results beyond ``HOUSEKEEPING_HUEY_RESULTS_KEEP``.
+
+    Runs hourly against Huey's own SQLite database, not Django's.
+    """
+    deleted = trim_huey_results(
+        HUEY, settings.HOUSEKEEPING_HUEY_RESULTS_KEEP, **budget()
+    )
+    logger.info("Trimmed %s stored task results", deleted)
+    return deleted
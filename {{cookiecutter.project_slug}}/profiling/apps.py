@@ -0,0 +1,20 @@
+"""
+App configuration for profiling app.
+"""
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+
+class ProfilingConfig(AppConfig):
+    name = "profiling"
+
+    def ready(self):
+        """Time the queries of profiled requests on every new connection."""
+        if settings.PROFILING_ENABLED:
+            from .profiler import install_query_recorder
+
+            connection_created.connect(
+                install_query_recorder, dispatch_uid="profiling.query_recorder"
+            )
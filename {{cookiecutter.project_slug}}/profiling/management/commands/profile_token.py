@@ -0,0 +1,20 @@
+"""
+Print an ``X-Profile`` header value that profiles requests without a staff login.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from profiling.middleware import make_token
+
+
+class Command(BaseCommand):
+    help = (
+        "Print a signed X-Profile header value, valid for "
+        "PROFILING_TOKEN_MAX_AGE seconds."
+    )
+
+    def handle(self, *args, **options):
+        if not settings.PROFILING_ENABLED:
+            self.stderr.write("PROFILING_ENABLED is off; the header will be ignored.")
+        self.stdout.write(make_token())
@@ -0,0 +1,108 @@
+"""
+Middleware profiling individual requests on demand.
+"""
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+
+from .profiler import RequestProfile
+from .reports import save_report
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_PARAM = "_profile"
+REPORT_HEADER = "X-Profile-Report"
+TOKEN_SALT = "profiling.token"
+
+
+def make_token() -> str:
+    """Return a signed ``X-Profile`` value, valid for ``PROFILING_TOKEN_MAX_AGE``."""
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign("profile")
+
+
+@sync_and_async_middleware
+def profiling_middleware(get_response):
+    """
+    Profile a request when a staff user or a signed header asks for it.
+
+    Staff users add ``?_profile`` to a URL or send any ``X-Profile`` header;
+    other clients send ``X-Profile`` with a token from ``make_token()``
+    (``manage.py profile_token``). The report id is returned in
+    ``X-Profile-Report``, or ``X-Profile: busy`` when another request is
+    being profiled. Place it after ``AuthenticationMiddleware``.
+
+    Requests that do not ask for a profile only pay for a header lookup and
+    the parsing of their query string: the user is not loaded.
+    """
+    if not settings.PROFILING_ENABLED:
+        raise MiddlewareNotUsed
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            if not _requested(request):
+                return await get_response(request)
+            trigger = _token_trigger(request) or _staff_trigger(await request.auser())
+            if trigger is None:
+                return await get_response(request)
+
+            profile = RequestProfile()
+            if not profile.start():
+                return _busy(await get_response(request))
+            try:
+                response = await get_response(request)
+            finally:
+                profile.stop()
+            response[REPORT_HEADER] = await sync_to_async(
+                save_report, thread_sensitive=False
+            )(profile, request, response, trigger)
+            return response
+
+    else:
+
+        def middleware(request):
+            if not _requested(request):
+                return get_response(request)
+            trigger = _token_trigger(request) or _staff_trigger(request.user)
+            if trigger is None:
+                return get_response(request)
+
+            profile = RequestProfile()
+            if not profile.start():
+                return _busy(get_response(request))
+            try:
+                response = get_response(request)
+            finally:
+                profile.stop()
+            response[REPORT_HEADER] = save_report(profile, request, response, trigger)
+            return response
+
+    return middleware
+
+
+def _requested(request) -> bool:
+    return "HTTP_X_PROFILE" in request.META or PROFILE_PARAM in request.GET
+
+
+def _token_trigger(request) -> str | None:
+    token = request.META.get("HTTP_X_PROFILE")
+    if not token:
+        return None
+    try:
+        signing.TimestampSigner(salt=TOKEN_SALT).unsign(
+            token, max_age=settings.PROFILING_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return None
+    return "signed header"
+
+
+def _staff_trigger(user) -> str | None:
+    return user.get_username() if user.is_staff else None
+
+
+def _busy(response):
+    response[PROFILE_HEADER] = "busy"
+    return response
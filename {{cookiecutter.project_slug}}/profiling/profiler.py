@@ -0,0 +1,93 @@
+"""
+Capture a cProfile profile and SQL query timings for a single request.
+
+``record_query`` sits permanently in every connection's ``execute_wrappers``
+(see ``ProfilingConfig.ready``) and only times a query when a profile is
+active in the current context, so requests that are not profiled pay one
+context variable lookup per query. The context variable follows the request
+into the thread that runs a sync view under ASGI, where thread-local
+connections could not be reached with ``connection.execute_wrapper()`` from
+the middleware.
+"""
+
+import cProfile
+import threading
+import time
+from contextvars import ContextVar, Token
+
+_active_profile: ContextVar["RequestProfile | None"] = ContextVar(
+    "active_profile", default=None
+)
+
+# cProfile hooks the whole interpreter (sys.monitoring), so only one profile
+# can run at a time per process.
+_profiler_lock = threading.Lock()
+
+
+class RequestProfile:
+    """
+    Profile of the code run between ``start()`` and ``stop()``.
+
+    cProfile sees every thread, including the worker thread a sync view runs
+    in under ASGI, so code of concurrent requests can appear in the stats;
+    queries are only recorded for the request that started the profile.
+    """
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        # SQL (with placeholders, not parameters) -> [count, seconds]
+        self.queries: dict[str, list] = {}
+        self.duration = 0.0
+        self._start = 0.0
+        self._token: Token | None = None
+
+    def start(self) -> bool:
+        """
+        Start profiling.
+
+        Returns:
+            False, without profiling, when another profile (or another
+            profiling tool, such as a debugger) is already running
+        """
+        if not _profiler_lock.acquire(blocking=False):
+            return False
+        try:
+            self.profiler.enable()
+        except ValueError:
+            _profiler_lock.release()
+            return False
+        self._token = _active_profile.set(self)
+        self._start = time.perf_counter()
+        return True
+
+    def stop(self) -> None:
+        """Stop profiling; must run in the context that called ``start()``."""
+        self.duration = time.perf_counter() - self._start
+        self.profiler.disable()
+        _active_profile.reset(self._token)
+        _profiler_lock.release()
+
+    def add_query(self, sql: str, seconds: float) -> None:
+        entry = self.queries.setdefault(sql, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def record_query(execute, sql, params, many, context):
+    """``execute_wrapper`` timing queries while a profile is active."""
+    profile = _active_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.add_query(sql, time.perf_counter() - start)
+
+
+def install_query_recorder(sender=None, connection=None, **kwargs) -> None:
+    """``connection_created`` receiver adding ``record_query`` to a connection."""
+    if record_query not in connection.execute_wrappers:
+        # First, so that ``connection.execute_wrapper()`` blocks, which pop
+        # the last wrapper, never remove it.
+        connection.execute_wrappers.insert(0, record_query)
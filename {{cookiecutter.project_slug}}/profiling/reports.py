@@ -0,0 +1,133 @@
+"""
+Profile reports stored as files under ``PROFILING_DIR``.
+
+A report is a JSON summary, ``<id>.json``, with the request, its SQL
+queries and the top of the cProfile stats, next to the raw stats dump,
+``<id>.prof``, which ``pstats`` or snakeviz can open. Report ids start with
+their UTC creation time, so sorting them sorts reports by age. After each
+new report the oldest ones are deleted to stay within
+``PROFILING_MAX_REPORTS`` and ``PROFILING_MAX_SIZE_MB``.
+"""
+
+import io
+import json
+import pstats
+import re
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.http import Http404
+from django.utils import timezone
+
+from .profiler import RequestProfile
+
+# Functions listed in the summary, by cumulative time.
+STATS_LIMIT = 60
+# Distinct SQL statements listed in the summary, by total time.
+QUERIES_LIMIT = 100
+
+REPORT_ID = re.compile(r"\d{8}T\d{12}-[0-9a-f]{8}")
+
+
+def save_report(profile: RequestProfile, request, response, trigger: str) -> str:
+    """
+    Write the report of a finished profile and rotate old reports.
+
+    Args:
+        profile: Stopped profile of the request
+        request: The profiled request
+        response: Its response
+        trigger: Who asked for the profile (a username or "signed header")
+
+    Returns:
+        The id of the new report
+    """
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    now = timezone.now()
+    report_id = f"{now:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profile.profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(STATS_LIMIT)
+    stats.dump_stats(directory / f"{report_id}.prof")
+
+    queries = sorted(profile.queries.items(), key=lambda item: -item[1][1])
+    summary = {
+        "id": report_id,
+        "created": now.isoformat(),
+        "method": request.method,
+        "path": request.get_full_path(),
+        "status": response.status_code,
+        "trigger": trigger,
+        "duration_ms": round(profile.duration * 1000, 3),
+        "query_count": sum(count for count, _ in profile.queries.values()),
+        "query_ms": round(sum(t for _, t in profile.queries.values()) * 1000, 3),
+        "queries": [
+            {"sql": sql, "count": count, "duration_ms": round(seconds * 1000, 3)}
+            for sql, (count, seconds) in queries[:QUERIES_LIMIT]
+        ],
+        "stats": stream.getvalue(),
+    }
+    (directory / f"{report_id}.json").write_text(json.dumps(summary))
+    rotate_reports(directory)
+    return report_id
+
+
+def rotate_reports(directory: Path) -> None:
+    """Delete the oldest reports beyond the configured count and size."""
+    max_bytes = settings.PROFILING_MAX_SIZE_MB * 1024 * 1024
+    kept = total = 0
+    for summary in sorted(directory.glob("*.json"), reverse=True):
+        files = (summary, summary.with_suffix(".prof"))
+        size = sum(_size(path) for path in files)
+        if kept < settings.PROFILING_MAX_REPORTS and total + size <= max_bytes:
+            kept += 1
+            total += size
+        else:
+            # Everything older goes too, even if it would still fit.
+            kept = settings.PROFILING_MAX_REPORTS
+            for path in files:
+                path.unlink(missing_ok=True)
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def list_reports() -> list[dict]:
+    """Return the summaries of stored reports, newest first, without stats."""
+    reports = []
+    for summary in sorted(Path(settings.PROFILING_DIR).glob("*.json"), reverse=True):
+        try:
+            report = json.loads(summary.read_text())
+        except (FileNotFoundError, ValueError):
+            continue
+        report.pop("stats", None)
+        report.pop("queries", None)
+        reports.append(report)
+    return reports
+
+
+def report_path(report_id: str, suffix: str) -> Path:
+    """
+    Return the path of a stored report file.
+
+    Raises:
+        Http404: The id is malformed or the file does not exist
+    """
+    if not REPORT_ID.fullmatch(report_id):
+        raise Http404
+    path = Path(settings.PROFILING_DIR) / f"{report_id}{suffix}"
+    if not path.is_file():
+        raise Http404
+    return path
+
+
+def get_report(report_id: str) -> dict:
+    """Return the full summary of a report; raises ``Http404`` like ``report_path``."""
+    return json.loads(report_path(report_id, ".json").read_text())
@@ -0,0 +1,24 @@
+"""
+URL configuration for profiling app, mounted under ``admin/profiles/``.
+"""
+
+from django.contrib import admin
+from django.urls import path
+
+from . import views
+
+app_name = "profiling"
+
+urlpatterns = [
+    path("", admin.site.admin_view(views.report_list), name="report-list"),
+    path(
+        "<slug:report_id>/",
+        admin.site.admin_view(views.report_detail),
+        name="report-detail",
+    ),
+    path(
+        "<slug:report_id>/download/",
+        admin.site.admin_view(views.report_download),
+        name="report-download",
+    ),
+]
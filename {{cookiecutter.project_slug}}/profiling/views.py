@@ -0,0 +1,43 @@
+"""
+Admin pages listing and showing stored profile reports.
+
+The views are wrapped in ``admin.site.admin_view`` in ``profiling.urls``, so
+only active staff users reach them.
+"""
+
+from django.contrib import admin
+from django.http import FileResponse
+from django.shortcuts import render
+from django.utils.translation import gettext_lazy as _
+
+from .reports import get_report, list_reports, report_path
+
+
+def report_list(request):
+    """List stored reports, newest first."""
+    context = {
+        **admin.site.each_context(request),
+        "title": _("Profiles"),
+        "reports": list_reports(),
+    }
+    return render(request, "profiling/report_list.html", context)
+
+
+def report_detail(request, report_id: str):
+    """Show a report's request, SQL queries and cProfile stats."""
+    report = get_report(report_id)
+    context = {
+        **admin.site.each_context(request),
+        "title": f"{report['method']} {report['path']}",
+        "report": report,
+    }
+    return render(request, "profiling/report_detail.html", context)
+
+
+def report_download(request, report_id: str):
+    """Download a report's raw cProfile stats, for pstats or snakeviz."""
+    return FileResponse(
+        report_path(report_id, ".prof").open("rb"),
+        as_attachment=True,
+        filename=f"{report_id}.prof",
+    )
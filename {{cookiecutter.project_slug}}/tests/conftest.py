@@ -0,0 +1,29 @@
+"""
+Fixtures shared across the test suite.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+@pytest.fixture
+def create_user():
+    def create(name: str, **extra):
+        return User.objects.create_user(
+            **{User.USERNAME_FIELD: f"{name}@example.com"}, password="pw", **extra
+        )
+
+    return create
+{%- if cookiecutter.include_accounts_app == "yes" %}
+
+
+@pytest.fixture
+def users(db):
+    User.objects.create_user(email="a@example.com", password="pw", first_name="A")
+    User.objects.create_user(email="b@example.com", password="pw", last_name="B,C")
+    User.objects.create_superuser(email="admin@example.com", password="pw")
+    # django-guardian creates its own anonymous user row; leave it out.
+    return User.objects.filter(email__endswith="@example.com").order_by("id")
+{%- endif %}
@@ -0,0 +1,9 @@
+"""
+Settings for the test suite: the project's settings plus test-only apps.
+"""
+
+from config.settings import *  # noqa: F403
+
+# Models used only by tests; without migrations, their tables are created
+# directly in the test database.
+INSTALLED_APPS = [*INSTALLED_APPS, "tests.testapp"]  # noqa: F405
@@ -0,0 +1,184 @@
+"""
+Tests for conditional GETs and JSON compression of API responses.
+"""
+
+import gzip
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory, override_settings
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from config.middleware import JSONGZipMiddleware
+
+User = get_user_model()
+
+
+@pytest.fixture
+def staff(db):
+    for i in range(30):
+        User.objects.create_user(email=f"user{i}@example.com", password="pw")
+    return User.objects.create_superuser(email="admin@example.com", password="pw")
+
+
+@pytest.fixture
+def staff_client(staff):
+    client = APIClient()
+    client.force_authenticate(staff)
+    return client
+
+
+def revalidate(client, url: str, response, **extra):
+    return client.get(url, HTTP_IF_NONE_MATCH=response["ETag"], **extra)
+
+
+@pytest.mark.django_db
+class TestConditionalUserList:
+    """Tests for ETags on the user list endpoint."""
+
+    def test_not_modified_skips_queryset_and_serializer(
+        self, staff_client, django_assert_num_queries
+    ):
+        """Test a matching ETag costs one aggregate query and no body."""
+        first = staff_client.get("/api/users/")
+        assert first.status_code == 200
+        assert first["ETag"]
+        assert "private" in first["Cache-Control"]
+
+        with django_assert_num_queries(1):
+            second = revalidate(staff_client, "/api/users/", first)
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second["ETag"] == first["ETag"]
+        assert len(first.content) > 500
+
+    def test_if_modified_since_is_ignored(self, staff_client):
+        """Test deletes and bulk updates are not hidden behind Last-Modified."""
+        first = staff_client.get("/api/users/")
+        assert "Last-Modified" not in first
+        since = http_date(time.time() + 60)
+
+        User.objects.filter(email="user0@example.com").delete()
+        deleted = staff_client.get("/api/users/", HTTP_IF_MODIFIED_SINCE=since)
+        assert deleted.status_code == 200
+
+        User.objects.filter(email="user1@example.com").update(first_name="Bulk")
+        updated = staff_client.get("/api/users/", HTTP_IF_MODIFIED_SINCE=since)
+        assert updated.status_code == 200
+        rows = {row["email"]: row for row in updated.data["results"]}
+        assert rows["user1@example.com"]["first_name"] == "Bulk"
+
+    def test_changes_invalidate(self, staff_client):
+        """Test updates and deletes produce a new ETag."""
+        first = staff_client.get("/api/users/")
+
+        user = User.objects.get(email="user3@example.com")
+        user.first_name = "Changed"
+        user.save()
+        updated = revalidate(staff_client, "/api/users/", first)
+        assert updated.status_code == 200
+        assert updated["ETag"] != first["ETag"]
+
+        User.objects.filter(email="user0@example.com").delete()
+        deleted = revalidate(staff_client, "/api/users/", updated)
+        assert deleted.status_code == 200
+
+    def test_etag_depends_on_page_and_user(self, staff_client, staff):
+        """Test ETags differ between pages and between users."""
+        page1 = staff_client.get("/api/users/")
+        page2 = staff_client.get("/api/users/?page=2")
+        assert page1["ETag"] != page2["ETag"]
+        assert revalidate(staff_client, "/api/users/?page=2", page1).status_code == 200
+
+        other = User.objects.create_superuser(email="other@example.com", password="pw")
+        staff_client.force_authenticate(other)
+        assert staff_client.get("/api/users/")["ETag"] != page1["ETag"]
+
+
+@pytest.mark.django_db
+class TestConditionalUserDetails:
+    """Tests for ETags on /api/auth/user/."""
+
+    def test_not_modified_without_queries(
+        self, staff_client, django_assert_num_queries
+    ):
+        """Test revalidating the current user needs no query at all."""
+        first = staff_client.get("/api/auth/user/")
+        assert first.status_code == 200
+
+        with django_assert_num_queries(0):
+            second = revalidate(staff_client, "/api/auth/user/", first)
+
+        assert second.status_code == 304
+
+    def test_if_modified_since(self, staff_client):
+        """Test Last-Modified is sent and honoured when no ETag is sent."""
+        first = staff_client.get("/api/auth/user/")
+        second = staff_client.get(
+            "/api/auth/user/", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        assert second.status_code == 304
+
+    def test_update_invalidates(self, staff_client, staff):
+        """Test editing the user changes the ETag."""
+        first = staff_client.get("/api/auth/user/")
+
+        updated = staff_client.patch("/api/auth/user/", {"first_name": "New"})
+        assert updated.status_code == 200
+        staff.refresh_from_db()
+        staff_client.force_authenticate(staff)
+
+        second = revalidate(staff_client, "/api/auth/user/", first)
+        assert second.status_code == 200
+        assert second.data["first_name"] == "New"
+
+
+class TestJSONGZipMiddleware:
+    """Tests for JSONGZipMiddleware."""
+
+    def process(self, response, accept_encoding: str = "gzip, deflate"):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        return JSONGZipMiddleware(lambda request: response)(request)
+
+    def test_compresses_large_json(self):
+        """Test JSON above the threshold is gzipped, saving most bytes."""
+        rows = [{"id": i, "email": f"user{i}@example.com"} for i in range(500)]
+        raw = JsonResponse(rows, safe=False).content
+
+        response = self.process(JsonResponse(rows, safe=False))
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert gzip.decompress(response.content) == raw
+        assert len(response.content) < len(raw) / 5
+
+    @override_settings(GZIP_MIN_LENGTH=1024)
+    def test_skips_small_json(self):
+        """Test JSON below GZIP_MIN_LENGTH is sent as is."""
+        response = self.process(JsonResponse({"data": "x" * 900}))
+        assert not response.has_header("Content-Encoding")
+
+    def test_skips_other_content_and_clients(self):
+        """Test HTML and clients without gzip support are left alone."""
+        html = self.process(HttpResponse("<p>hello</p>" * 500))
+        assert not html.has_header("Content-Encoding")
+
+        rows = [{"id": i} for i in range(500)]
+        plain = self.process(JsonResponse(rows, safe=False), accept_encoding="br")
+        assert not plain.has_header("Content-Encoding")
+
+    @override_settings(GZIP_MIN_LENGTH=0)
+    def test_weak_etag_still_revalidates(self, staff_client):
+        """Test compressed responses' weak ETags still get 304s."""
+        first = staff_client.get("/api/users/", HTTP_ACCEPT_ENCODING="gzip")
+        assert first["Content-Encoding"] == "gzip"
+        assert first["ETag"].startswith('W/"')
+
+        second = revalidate(
+            staff_client, "/api/users/", first, HTTP_ACCEPT_ENCODING="gzip"
+        )
+        assert second.status_code == 304
@@ -0,0 +1,196 @@
+"""
+Tests for the streaming user export.
+"""
+
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import AsyncRequestFactory, RequestFactory
+from django.utils import timezone
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from rest_framework.test import APIClient
+{%- endif %}
+
+from accounts.export import EXPORT_FIELDS, export_response, iter_batches
+
+User = get_user_model()
+
+PROC_SELF = Path("/proc/self")
+
+
+def read_body(response) -> bytes:
+    """Consume a streaming response, sync or async."""
+    if response.is_async:
+
+        async def consume():
+            return b"".join([chunk async for chunk in response])
+
+        return async_to_sync(consume)()
+    return b"".join(response)
+
+
+def peak_rss_kb() -> int:
+    """Return the process's peak resident set size since the last reset."""
+    for line in (PROC_SELF / "status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1])
+    raise AssertionError("VmHWM missing from /proc/self/status")
+
+
+def seed_users(count: int) -> None:
+    """Insert ``count`` users in one statement, without Python model objects."""
+    table = connection.ops.quote_name(User._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (email, password, first_name, last_name,
+                                 is_superuser, is_staff, is_active, date_joined,
+                                 updated_at)
+            WITH RECURSIVE seq(n) AS (
+                SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < %s
+            )
+            SELECT 'seeded' || n || '@example.com', '', 'Kirabo', 'Ibrahim',
+                   %s, %s, %s, %s, %s
+            FROM seq
+            """,
+            [count, False, False, True, timezone.now(), timezone.now()],
+        )
+
+
+@pytest.mark.django_db
+class TestExportResponse:
+    """Tests for export_response."""
+
+    def test_csv(self, users):
+        """Test CSV output has a header and one row per user, in pk order."""
+        response = export_response(RequestFactory().get("/"), users, "csv")
+
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        assert response["Content-Disposition"].endswith('.csv"')
+        rows = list(csv.reader(io.StringIO(read_body(response).decode())))
+        assert tuple(rows[0]) == EXPORT_FIELDS
+        assert [row[1] for row in rows[1:]] == list(
+            users.order_by("pk").values_list("email", flat=True)
+        )
+        assert rows[2][3] == "B,C"
+
+    @pytest.mark.parametrize("value", ["=1+2", "+1", "-1", "@SUM(A1)", "\tx", "\rx"])
+    def test_csv_escapes_formulas(self, users, value):
+        """Test text a spreadsheet would evaluate is prefixed with a quote."""
+        users.filter(email="a@example.com").update(first_name=value, last_name=value)
+
+        response = export_response(RequestFactory().get("/"), users, "csv")
+
+        rows = list(csv.reader(io.StringIO(read_body(response).decode())))
+        assert rows[1][2:4] == [f"'{value}", f"'{value}"]
+        assert rows[2][2:4] == ["", "B,C"]
+
+    def test_jsonl(self, users):
+        """Test JSON Lines output has one object per user and no password."""
+        response = export_response(RequestFactory().get("/"), users, "jsonl")
+
+        lines = read_body(response).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert len(records) == 3
+        assert set(records[0]) == set(EXPORT_FIELDS)
+        assert records[0]["email"] == "a@example.com"
+        assert records[0]["last_login"] is None
+
+    def test_batches_cover_all_rows(self, users):
+        """Test keyset batches neither skip nor repeat rows."""
+        batches = list(iter_batches(users, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        ids = [row[0] for batch in batches for row in batch]
+        assert ids == sorted(users.values_list("pk", flat=True))
+
+    def test_async_body_under_asgi(self, users):
+        """Test ASGI requests get an async iterator with the same content."""
+        sync_response = export_response(RequestFactory().get("/"), users, "jsonl")
+        async_response = export_response(
+            AsyncRequestFactory().get("/"), users, "jsonl", batch_size=1
+        )
+
+        assert not sync_response.is_async
+        assert async_response.is_async
+        assert read_body(async_response) == read_body(sync_response)
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"), reason="needs /proc peak RSS reset"
+    )
+    def test_memory_is_constant(self, db):
+        """Test exporting a large table does not grow peak RSS with its size."""
+        seed_users(100_000)
+        response = export_response(RequestFactory().get("/"), User.objects.all(), "csv")
+
+        # Writing 5 resets the peak RSS (VmHWM) to the current RSS.
+        (PROC_SELF / "clear_refs").write_text("5")
+        baseline = peak_rss_kb()
+        exported = sum(len(chunk) for chunk in response)
+        growth_kb = peak_rss_kb() - baseline
+
+        assert exported > 8 * 1024 * 1024
+        # Loading the users as instances would take well over 100 MB.
+        assert growth_kb < 8 * 1024, f"peak RSS grew by {growth_kb} kB"
+
+
+@pytest.mark.django_db
+class TestAdminExport:
+    """Tests for the UserAdmin export actions."""
+
+    def test_export_selected_users(self, client, users):
+        """Test the admin action streams only the selected users."""
+        client.force_login(users.get(email="admin@example.com"))
+        selected = users.filter(email__in=["a@example.com", "b@example.com"])
+
+        response = client.post(
+            "/admin/accounts/user/",
+            {
+                "action": "export_csv",
+                "_selected_action": [user.pk for user in selected],
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.streaming
+        rows = list(csv.reader(io.StringIO(read_body(response).decode())))
+        assert [row[1] for row in rows[1:]] == ["a@example.com", "b@example.com"]
+{%- if cookiecutter.use_rest_framework == "yes" %}
+
+
+@pytest.mark.django_db
+class TestUserExportView:
+    """Tests for the staff-only export endpoint."""
+
+    def test_streams_all_users(self, users):
+        """Test staff can download every user as JSON Lines."""
+        client = APIClient()
+        client.force_authenticate(users.get(email="admin@example.com"))
+
+        response = client.get("/api/users/export.jsonl")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = read_body(response).decode().splitlines()
+        assert len(lines) == User.objects.count()
+
+    def test_requires_staff(self, users):
+        """Test non-staff users are rejected."""
+        client = APIClient()
+        client.force_authenticate(users.get(email="a@example.com"))
+        assert client.get("/api/users/export.csv").status_code == 403
+
+    def test_unknown_format(self, users):
+        """Test formats other than CSV and JSON Lines are not routed."""
+        client = APIClient()
+        client.force_authenticate(users.get(email="admin@example.com"))
+        assert client.get("/api/users/export.xml").status_code == 404
+{%- endif %}
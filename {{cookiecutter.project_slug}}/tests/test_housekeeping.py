@@ -0,0 +1,187 @@
+"""
+Tests for housekeeping app.
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.utils import timezone
+from huey import MemoryHuey, SqliteHuey
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+{%- endif %}
+
+from housekeeping.cleanup import delete_in_batches, trim_huey_results
+{%- if cookiecutter.session_backend in ["db", "cached_db"] and cookiecutter.use_rest_framework == "yes" %}
+from housekeeping.tasks import clear_expired_sessions, clear_expired_tokens
+{%- elif cookiecutter.session_backend in ["db", "cached_db"] %}
+from housekeeping.tasks import clear_expired_sessions
+{%- elif cookiecutter.use_rest_framework == "yes" %}
+from housekeeping.tasks import clear_expired_tokens
+{%- endif %}
+
+
+def create_sessions(count: int, expire_in: timedelta) -> None:
+    expire_date = timezone.now() + expire_in
+    Session.objects.bulk_create(
+        Session(
+            session_key=f"{expire_in.days}-{i}",
+            session_data="",
+            expire_date=expire_date,
+        )
+        for i in range(count)
+    )
+
+
+@pytest.fixture
+def huey(tmp_path):
+    return SqliteHuey(filename=str(tmp_path / "huey.sqlite3"))
+
+
+@pytest.mark.django_db
+class TestDeleteInBatches:
+    """Tests for delete_in_batches."""
+
+    def test_deletes_across_batches(self):
+        """Test all matching rows are deleted when they span several batches."""
+        create_sessions(25, timedelta(days=-1))
+        create_sessions(5, timedelta(days=1))
+
+        deleted = delete_in_batches(
+            Session.objects.filter(expire_date__lt=timezone.now()), batch_size=10
+        )
+
+        assert deleted == 25
+        assert Session.objects.count() == 5
+
+    def test_nothing_to_delete(self):
+        """Test an empty queryset deletes nothing."""
+        assert delete_in_batches(Session.objects.none()) == 0
+
+    def test_stops_when_time_budget_is_spent(self):
+        """Test no new batch starts once the time budget is used up."""
+        create_sessions(25, timedelta(days=-1))
+
+        deleted = delete_in_batches(Session.objects.all(), batch_size=10, time_budget=0)
+
+        assert deleted == 10
+        assert Session.objects.count() == 15
+
+
+class TestTrimHueyResults:
+    """Tests for trim_huey_results."""
+
+    def test_keeps_newest_results(self, huey):
+        """Test the oldest results are deleted; revocations and locks are kept."""
+
+        @huey.task()
+        def nightly():
+            pass
+
+        nightly.revoke()
+        for i in range(10):
+            huey.put_result(f"task-{i}", i)
+        huey.storage.put_data("r:task-0", b"")
+        huey.storage.put_data(f"{huey.name}.lock.nightly", b"1")
+
+        assert trim_huey_results(huey, keep=3, batch_size=2) == 7
+        items = huey.storage.result_items()
+        assert {key for key in items if key.startswith("task-")} == {
+            "task-7",
+            "task-8",
+            "task-9",
+        }
+        assert {"r:task-0", f"{huey.name}.lock.nightly"} <= items.keys()
+        assert nightly.is_revoked()
+
+    def test_stops_when_time_budget_is_spent(self, huey):
+        """Test a spent time budget stops after one batch."""
+        for i in range(10):
+            huey.put_result(f"task-{i}", i)
+
+        assert trim_huey_results(huey, keep=0, batch_size=4, time_budget=0) == 4
+        assert huey.result_count() == 6
+
+    def test_other_storage_is_rejected(self):
+        """Test storages without rowid order are refused rather than guessed at."""
+        with pytest.raises(TypeError):
+            trim_huey_results(MemoryHuey(), keep=0)
+{%- if cookiecutter.session_backend in ["db", "cached_db"] %}
+
+
+@pytest.mark.django_db
+class TestClearExpiredSessions:
+    """Tests for the clear_expired_sessions periodic task."""
+
+    def test_clears_only_expired_sessions(self):
+        """Test expired sessions are removed and live ones are kept."""
+        create_sessions(3, timedelta(days=-1))
+        create_sessions(2, timedelta(days=1))
+
+        assert clear_expired_sessions.call_local() == 3
+        assert Session.objects.count() == 2
+{%- endif %}
+{%- if cookiecutter.use_rest_framework == "yes" %}
+
+
+@pytest.mark.django_db
+class TestClearExpiredTokens:
+    """Tests for the clear_expired_tokens periodic task."""
+
+    def test_deletes_expired_tokens_and_blacklist_entries(self, create_user):
+        """Test expired tokens and their blacklist rows go, live ones stay."""
+        live = OutstandingToken.objects.get(
+            jti=RefreshToken.for_user(create_user("alice"))["jti"]
+        )
+        expired = [
+            OutstandingToken.objects.create(
+                jti=f"expired-{i}",
+                token="",
+                expires_at=timezone.now() - timedelta(days=i + 1),
+            )
+            for i in range(2)
+        ]
+        BlacklistedToken.objects.create(token=expired[0])
+        BlacklistedToken.objects.create(token=live)
+
+        assert clear_expired_tokens.call_local() == 3
+
+        assert list(OutstandingToken.objects.all()) == [live]
+        assert BlacklistedToken.objects.get().token == live
+{%- endif %}
+
+
+@pytest.mark.django_db
+class TestTableGrowth:
+    """Tests for the table_growth management command."""
+
+    def test_reports_growth_since_previous_run(self, tmp_path):
+        """Test row count changes are shown against the saved snapshot."""
+        snapshot = tmp_path / "table_growth.json"
+        call_command("table_growth", snapshot=snapshot, stdout=StringIO())
+        create_sessions(3, timedelta(days=1))
+
+        out = StringIO()
+        call_command("table_growth", snapshot=snapshot, limit=0, stdout=out)
+
+        row = next(
+            line
+            for line in out.getvalue().splitlines()
+            if line.startswith("django_session ")
+        )
+        assert row.split()[1:3] == ["3", "+3"]
+
+    def test_no_save_keeps_snapshot(self, tmp_path):
+        """Test --no-save leaves the snapshot file alone."""
+        snapshot = tmp_path / "table_growth.json"
+
+        call_command("table_growth", snapshot=snapshot, no_save=True, stdout=StringIO())
+
+        assert not snapshot.exists()
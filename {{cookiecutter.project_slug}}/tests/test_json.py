@@ -0,0 +1,122 @@
+"""
+Compatibility tests for the orjson renderer and parser against DRF's stdlib ones.
+"""
+
+import datetime
+import decimal
+import io
+import uuid
+from collections import OrderedDict
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from config.parsers import ORJSONParser
+from config.renderers import ORJSONRenderer
+
+UTC = datetime.UTC
+
+PAYLOADS = {
+    "scalars": {"int": 1, "float": 1.5, "bool": True, "none": None, "str": "x"},
+    "unicode": {"name": "Kíràbo Ibrahim 🚀", "sep": "a\u2028b\u2029c"},
+    "nested": {"items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}]},
+    "list": [1, "two", [3], {"four": 4}],
+    "ordered_dict": OrderedDict([("b", 1), ("a", 2)]),
+    "int_keys": {1: "one", 2: "two"},
+    "decimal": {"price": decimal.Decimal("19.99")},
+    "uuid": {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    "lazy_string": {"detail": _("Invalid email or password")},
+    "datetime_utc": {"at": datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, UTC)},
+    "datetime_zoneinfo": {
+        "at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("Africa/Kampala"))
+    },
+    "datetime_naive": {"at": datetime.datetime(2024, 1, 2, 3, 4, 5)},
+    "date": {"on": datetime.date(2024, 1, 2)},
+    "time": {"at": datetime.time(3, 4, 5, 600)},
+    "timedelta": {"took": datetime.timedelta(seconds=90, microseconds=5)},
+    "tuple": {"pair": (1, 2)},
+    "bytes": {"blob": b"raw"},
+    "big_int": {"n": 2**70},
+}
+
+
+@pytest.fixture(params=list(PAYLOADS), ids=list(PAYLOADS))
+def payload(request):
+    return PAYLOADS[request.param]
+
+
+class TestORJSONRenderer:
+    """Tests for ORJSONRenderer."""
+
+    def test_matches_stdlib_renderer(self, payload):
+        """Test output is byte-for-byte identical to DRF's JSONRenderer."""
+        assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_none_renders_empty(self):
+        """Test None renders as an empty body like DRF."""
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_indent_falls_back_to_stdlib(self):
+        """Test indented output (browsable API) matches DRF."""
+        context = {"indent": 4}
+        data = PAYLOADS["nested"]
+        expected = JSONRenderer().render(data, renderer_context=context)
+        assert ORJSONRenderer().render(data, renderer_context=context) == expected
+
+    def test_aware_time_is_rejected(self):
+        """Test timezone-aware times raise like DRF."""
+        aware = datetime.time(3, 4, tzinfo=UTC)
+        with pytest.raises(ValueError):
+            ORJSONRenderer().render({"at": aware})
+
+    @pytest.mark.parametrize(
+        "value",
+        [float("nan"), float("inf"), -float("inf"), decimal.Decimal("NaN")],
+        ids=["nan", "inf", "-inf", "decimal_nan"],
+    )
+    def test_non_finite_is_rejected_when_strict(self, value):
+        """Test NaN and infinity raise like DRF instead of becoming null."""
+        data = {"items": [{"score": value, "note": None}]}
+        with pytest.raises(ValueError):
+            JSONRenderer().render(data)
+        with pytest.raises(ValueError):
+            ORJSONRenderer().render(data)
+
+    def test_non_finite_renders_null_when_not_strict(self, monkeypatch):
+        """Test STRICT_JSON=False renders NaN as null instead of raising."""
+        monkeypatch.setattr(ORJSONRenderer, "strict", False)
+        assert ORJSONRenderer().render({"score": float("nan")}) == b'{"score":null}'
+
+
+class TestORJSONParser:
+    """Tests for ORJSONParser."""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"a": 1, "b": [1, 2.5, null, true], "c": {"d": "\\u00e9"}}',
+            '{"name": "Kíràbo 🚀"}'.encode(),
+            b"[]",
+        ],
+    )
+    def test_matches_stdlib_parser(self, body):
+        """Test parsed data equals DRF's JSONParser output."""
+        expected = JSONParser().parse(io.BytesIO(body))
+        assert ORJSONParser().parse(io.BytesIO(body)) == expected
+
+    def test_other_encoding(self):
+        """Test request bodies in a non UTF-8 charset are decoded first."""
+        body = '{"name": "Kíràbo"}'.encode("latin-1")
+        context = {"encoding": "latin-1"}
+        data = ORJSONParser().parse(io.BytesIO(body), parser_context=context)
+        assert data == {"name": "Kíràbo"}
+
+    @pytest.mark.parametrize("body", [b"{", b'{"a": NaN}', b"\xff"])
+    def test_invalid_json_raises_parse_error(self, body):
+        """Test malformed and non-strict JSON raise ParseError."""
+        with pytest.raises(ParseError, match="JSON parse error"):
+            ORJSONParser().parse(io.BytesIO(body))
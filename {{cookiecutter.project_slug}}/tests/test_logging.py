@@ -0,0 +1,144 @@
+"""
+Tests for the queue-based structured logging in config.log.
+"""
+
+import json
+import logging
+from logging.handlers import QueueListener
+from queue import SimpleQueue
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from config.log import (
+    JSONFormatter,
+    NonBlockingQueueHandler,
+    RequestContextFilter,
+    SamplingFilter,
+    request_context_middleware,
+)
+
+
+class ListHandler(logging.Handler):
+    """Handler that keeps formatted records in memory."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(JSONFormatter())
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def queued_logger():
+    """Logger wired like settings.LOGGING: filter -> queue -> listener."""
+    target = ListHandler()
+    queue = SimpleQueue()
+    handler = NonBlockingQueueHandler(queue)
+    handler.addFilter(RequestContextFilter())
+    listener = QueueListener(queue, target)
+    listener.start()
+
+    logger = logging.getLogger("tests.logging")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    yield logger, listener, target
+    if listener._thread is not None:
+        listener.stop()
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter."""
+
+    def test_formats_message_and_context(self):
+        """Test records render as JSON with context fields."""
+        record = logging.LogRecord(
+            "app", logging.INFO, __file__, 1, "hello %s", ("world",), None
+        )
+        record.request_id = "abc"
+        record.user_id = 7
+        record.route = "api/items/"
+        record.duration_ms = 1.5
+
+        payload = json.loads(JSONFormatter().format(record))
+
+        assert payload["message"] == "hello world"
+        assert payload["level"] == "INFO"
+        assert payload["request_id"] == "abc"
+        assert payload["user_id"] == 7
+        assert payload["route"] == "api/items/"
+        assert payload["duration_ms"] == 1.5
+
+
+class TestSamplingFilter:
+    """Tests for SamplingFilter."""
+
+    def test_drops_sampled_levels(self):
+        """Test a zero rate drops records below the always level."""
+        sampler = SamplingFilter(rate=0.0)
+        info = logging.LogRecord("x", logging.WARNING, "", 1, "", (), None)
+        error = logging.LogRecord("x", logging.ERROR, "", 1, "", (), None)
+        assert not sampler.filter(info)
+        assert sampler.filter(error)
+
+    def test_full_rate_keeps_everything(self):
+        """Test the default rate keeps every record."""
+        record = logging.LogRecord("x", logging.DEBUG, "", 1, "", (), None)
+        assert SamplingFilter().filter(record)
+
+
+class TestQueueLogging:
+    """Tests for the queue handler and request context middleware."""
+
+    def test_records_reach_listener(self, queued_logger):
+        """Test records logged outside a request are written by the listener."""
+        logger, listener, target = queued_logger
+        logger.info("value=%s", {"a": 1})
+        listener.stop()
+
+        payload = json.loads(target.lines[0])
+        assert payload["message"] == "value={'a': 1}"
+        assert "request_id" not in payload
+
+    def test_traceback_is_formatted_by_listener(self, queued_logger):
+        """Test exception info survives the queue and is rendered as text."""
+        logger, listener, target = queued_logger
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        listener.stop()
+
+        payload = json.loads(target.lines[0])
+        assert payload["message"] == "failed"
+        assert "ValueError: boom" in payload["exc_info"]
+
+    def test_request_context_is_attached(self, queued_logger):
+        """Test records logged during a request carry the request metadata."""
+        logger, listener, target = queued_logger
+
+        def view(request):
+            logger.info("inside view")
+            return HttpResponse("ok")
+
+        request = RequestFactory().get("/items/", HTTP_X_REQUEST_ID="req-1")
+        request.user = AnonymousUser()
+        response = request_context_middleware(view)(request)
+        listener.stop()
+
+        payload = json.loads(target.lines[0])
+        assert response["X-Request-ID"] == "req-1"
+        assert payload["request_id"] == "req-1"
+        assert payload["duration_ms"] >= 0
+        assert "user_id" not in payload
+
+    def test_request_id_is_generated(self):
+        """Test a request id is generated when the client sends none."""
+        request = RequestFactory().get("/")
+        response = request_context_middleware(lambda r: HttpResponse())(request)
+        assert len(response["X-Request-ID"]) == 32
@@ -0,0 +1,177 @@
+"""
+Tests for protected media delivery, with the test-only ``Document`` model.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from django.conf import settings
+{%- endif %}
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.core.files.base import ContentFile
+from django.http import Http404
+from django.test import AsyncRequestFactory, Client, RequestFactory, override_settings
+from guardian.shortcuts import assign_perm
+from guardian.utils import get_anonymous_user
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from rest_framework_simplejwt.tokens import AccessToken
+{%- endif %}
+
+from config.media import protected_file_response, serve_protected_media
+from tests.testapp.models import Document
+
+User = get_user_model()
+
+
+@pytest.fixture
+def media_root(tmp_path):
+    with override_settings(PROTECTED_MEDIA_ROOT=tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def view_permission(db):
+    return Permission.objects.get(
+        codename="view_document", content_type__app_label="testapp"
+    )
+
+
+@pytest.fixture
+def document(view_permission, media_root):
+    document = Document()
+    document.file.save("report.pdf", ContentFile(b"%PDF-1.7 secret"))
+    return document
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(
+        **{User.USERNAME_FIELD: "reader@example.com"}, password="pw"
+    )
+
+
+def download(document, user=None):
+    client = Client()
+    if user is not None:
+        client.force_login(user)
+    return client.get(document.file.url)
+
+
+class TestProtectedFileField:
+    """Tests for ProtectedFileField."""
+
+    def test_stored_outside_media_root(self, document, media_root):
+        """Test files are named after their field and stored in PROTECTED_MEDIA_ROOT."""
+        assert document.file.name == "testapp/document/file/docs/report.pdf"
+        assert (media_root / document.file.name).read_bytes() == b"%PDF-1.7 secret"
+        assert document.file.url == f"/protected-media/{document.file.name}"
+
+    def test_deconstruct_omits_defaults(self):
+        """Test migrations do not serialize the storage or the index."""
+        _, path, _, kwargs = Document._meta.get_field("file").deconstruct()
+        assert path == "config.media.ProtectedFileField"
+        assert kwargs == {"upload_to": "docs/"}
+
+
+@pytest.mark.django_db
+class TestServeProtectedMedia:
+    """Tests for serve_protected_media."""
+
+    def test_denied_without_permission(self, document, user):
+        """Test anonymous users and users without permission get 403."""
+        assert download(document).status_code == 403
+        assert download(document, user).status_code == 403
+
+    def test_object_permission(self, document, user, view_permission):
+        """Test a guardian permission on the object grants that file only."""
+        other = Document.objects.create(file="testapp/document/file/docs/other.pdf")
+        assign_perm(view_permission, user, document)
+
+        response = download(document, user)
+
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content) == b"%PDF-1.7 secret"
+        assert response["Content-Type"] == "application/pdf"
+        assert "private" in response["Cache-Control"]
+        assert download(other, user).status_code == 403
+
+    def test_model_permission(self, document, user, view_permission):
+        """Test a model-wide permission grants every file."""
+        user.user_permissions.add(view_permission)
+        assert download(document, user).status_code == 200
+
+    def test_anonymous_object_permission(self, document, view_permission):
+        """Test files can be made public through guardian's anonymous user."""
+        assign_perm(view_permission, get_anonymous_user(), document)
+        assert download(document).status_code == 200
+{%- if cookiecutter.use_rest_framework == "yes" %}
+
+    def test_jwt_access_token(self, document, user, view_permission):
+        """Test API clients authenticate with the JWT cookie or header."""
+        user.user_permissions.add(view_permission)
+        token = str(AccessToken.for_user(user))
+        cookie_client = Client()
+        cookie_client.cookies[settings.REST_AUTH["JWT_AUTH_COOKIE"]] = token
+
+        response = cookie_client.get(document.file.url)
+        bearer = Client().get(document.file.url, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        assert response.status_code == 200
+        assert "Authorization" in response["Vary"]
+        assert bearer.status_code == 200
+
+    def test_invalid_jwt_is_anonymous(self, document):
+        """Test a bad access token is treated as no login at all."""
+        client = Client()
+        client.cookies[settings.REST_AUTH["JWT_AUTH_COOKIE"]] = "not-a-token"
+        assert client.get(document.file.url).status_code == 403
+{%- endif %}
+
+    @override_settings(PROTECTED_MEDIA_X_ACCEL_PREFIX="/_protected/")
+    def test_x_accel_redirect(self, document):
+        """Test nginx is asked to send the file when a prefix is configured."""
+        request = RequestFactory().get(document.file.url)
+        request.user = User.objects.create_superuser(
+            **{User.USERNAME_FIELD: "admin@example.com"}, password="pw"
+        )
+
+        response = serve_protected_media(request, document.file.name)
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response["X-Accel-Redirect"] == (
+            "/_protected/testapp/document/file/docs/report.pdf"
+        )
+        assert response["Content-Type"] == "application/pdf"
+        assert response["Content-Disposition"] == 'inline; filename="report.pdf"'
+
+    def test_async_iterator_under_asgi(self, document):
+        """Test ASGI responses stream chunks instead of reading the whole file."""
+        request = AsyncRequestFactory().get(document.file.url)
+
+        response = protected_file_response(request, document.file.name)
+
+        async def consume():
+            return b"".join([chunk async for chunk in response])
+
+        assert response.is_async
+        assert response["Content-Length"] == "15"
+        assert async_to_sync(consume)() == b"%PDF-1.7 secret"
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "testapp/document/file/docs/missing.pdf",
+            "auth/user/password/x",
+            "nope/document/file/x",
+            "testapp/document/file/../../../../etc/passwd",
+            "report.pdf",
+        ],
+    )
+    def test_unknown_files(self, document, name):
+        """Test names not owned by a protected field's object are 404s."""
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        with pytest.raises(Http404):
+            serve_protected_media(request, name)
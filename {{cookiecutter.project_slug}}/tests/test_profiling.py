@@ -0,0 +1,185 @@
+"""
+Tests for on-demand request profiling.
+"""
+
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, Client
+
+from profiling.middleware import REPORT_HEADER, make_token
+from profiling.profiler import RequestProfile
+from profiling.reports import list_reports, rotate_reports
+
+User = get_user_model()
+
+
+@pytest.fixture
+def reports_dir(settings, tmp_path):
+    settings.PROFILING_DIR = tmp_path
+    return tmp_path
+
+
+def client_for(user=None) -> Client:
+    client = Client()
+    if user is not None:
+        client.force_login(user)
+    return client
+
+
+def read_report(reports_dir, report_id: str) -> dict:
+    return json.loads((reports_dir / f"{report_id}.json").read_text())
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    """Tests for profiling_middleware."""
+
+    def test_not_profiled_unless_asked(self, reports_dir, create_user):
+        """Test staff requests without ?_profile or X-Profile are left alone."""
+        response = client_for(create_user("staff", is_staff=True)).get("/admin/")
+
+        assert response.status_code == 200
+        assert REPORT_HEADER not in response
+        assert not list(reports_dir.iterdir())
+
+    def test_staff_query_param(self, reports_dir, create_user):
+        """Test ?_profile profiles a staff request, with its SQL queries."""
+        client = client_for(create_user("staff", is_staff=True))
+
+        response = client.get("/admin/?_profile")
+
+        report = read_report(reports_dir, response[REPORT_HEADER])
+        assert report["path"] == "/admin/?_profile"
+        assert report["status"] == 200
+        assert report["trigger"] == "staff@example.com"
+        assert report["query_count"] == sum(q["count"] for q in report["queries"]) > 0
+        assert any("django_admin_log" in query["sql"] for query in report["queries"])
+        assert "cumulative" in report["stats"]
+        assert (reports_dir / f"{response[REPORT_HEADER]}.prof").exists()
+
+    def test_query_param_must_match_exactly(self, reports_dir, create_user):
+        """Test parameters merely containing "_profile" do not trigger a profile."""
+        client = client_for(create_user("staff", is_staff=True))
+
+        response = client.get("/admin/?x_profile=1&q=my_profile")
+
+        assert response.status_code == 200
+        assert REPORT_HEADER not in response
+        assert not list(reports_dir.iterdir())
+
+    def test_ignored_for_other_users(self, reports_dir, create_user):
+        """Test non-staff users cannot trigger a profile without a token."""
+        client = client_for(create_user("alice"))
+
+        response = client.get("/health/?_profile", headers={"X-Profile": "1"})
+
+        assert response.status_code == 200
+        assert REPORT_HEADER not in response
+
+    def test_signed_header(self, reports_dir, settings):
+        """Test a valid token profiles anonymous requests; bad ones do not."""
+        response = client_for().get("/health/", headers={"X-Profile": make_token()})
+        assert read_report(reports_dir, response[REPORT_HEADER])["trigger"] == (
+            "signed header"
+        )
+
+        response = client_for().get("/health/", headers={"X-Profile": "profile:x:y"})
+        assert REPORT_HEADER not in response
+
+        settings.PROFILING_TOKEN_MAX_AGE = -1
+        response = client_for().get("/health/", headers={"X-Profile": make_token()})
+        assert REPORT_HEADER not in response
+
+    def test_async_request(self, reports_dir):
+        """Test requests served through the ASGI handler are profiled too."""
+        get = async_to_sync(AsyncClient().get)
+
+        response = get("/health/", headers={"X-Profile": make_token()})
+
+        assert read_report(reports_dir, response[REPORT_HEADER])["status"] == 200
+
+    def test_one_profile_at_a_time(self, reports_dir):
+        """Test a request arriving while another is profiled is marked busy."""
+        running = RequestProfile()
+        assert running.start()
+        try:
+            response = client_for().get("/health/", headers={"X-Profile": make_token()})
+        finally:
+            running.stop()
+
+        assert response["X-Profile"] == "busy"
+        assert REPORT_HEADER not in response
+
+    def test_disabled(self, reports_dir, settings):
+        """Test PROFILING_ENABLED=False removes the middleware."""
+        settings.PROFILING_ENABLED = False
+
+        response = client_for().get("/health/", headers={"X-Profile": make_token()})
+
+        assert REPORT_HEADER not in response
+
+
+class TestRotateReports:
+    """Tests for rotate_reports."""
+
+    @staticmethod
+    def write(directory, report_id: str, size: int) -> None:
+        (directory / f"{report_id}.json").write_text(json.dumps({"id": report_id}))
+        (directory / f"{report_id}.prof").write_bytes(b"x" * size)
+
+    def test_keeps_newest_reports(self, reports_dir, settings):
+        """Test reports beyond PROFILING_MAX_REPORTS are deleted, oldest first."""
+        settings.PROFILING_MAX_REPORTS = 2
+        for day in range(1, 5):
+            self.write(reports_dir, f"2025010{day}T000000000000-0000000{day}", 10)
+
+        rotate_reports(reports_dir)
+
+        assert [r["id"] for r in list_reports()] == [
+            "20250104T000000000000-00000004",
+            "20250103T000000000000-00000003",
+        ]
+        assert len(list(reports_dir.iterdir())) == 4
+
+    def test_size_cap(self, reports_dir, settings):
+        """Test older reports go once the newer ones fill PROFILING_MAX_SIZE_MB."""
+        settings.PROFILING_MAX_SIZE_MB = 1
+        self.write(reports_dir, "20250101T000000000000-00000001", 10)
+        self.write(reports_dir, "20250102T000000000000-00000002", 600 * 1024)
+        self.write(reports_dir, "20250103T000000000000-00000003", 600 * 1024)
+
+        rotate_reports(reports_dir)
+
+        assert [r["id"] for r in list_reports()] == ["20250103T000000000000-00000003"]
+
+
+@pytest.mark.django_db
+class TestReportAdmin:
+    """Tests for the /admin/profiles/ pages."""
+
+    def test_staff_only(self, reports_dir, create_user):
+        """Test anonymous and non-staff users are sent to the admin login."""
+        for user in (None, create_user("alice")):
+            response = client_for(user).get("/admin/profiles/")
+            assert response.status_code == 302
+            assert response["Location"].startswith("/admin/login/")
+
+    def test_list_detail_and_download(self, reports_dir, create_user):
+        """Test staff can list, open and download a report."""
+        client = client_for(create_user("staff", is_staff=True))
+        report_id = client.get("/admin/?_profile")[REPORT_HEADER]
+
+        listing = client.get("/admin/profiles/")
+        detail = client.get(f"/admin/profiles/{report_id}/")
+        download = client.get(f"/admin/profiles/{report_id}/download/")
+
+        assert f"/admin/profiles/{report_id}/" in listing.content.decode()
+        assert "SQL queries" in detail.content.decode()
+        assert download["Content-Disposition"] == (
+            f'attachment; filename="{report_id}.prof"'
+        )
+        missing = "/admin/profiles/20250101T000000000000-00000000/"
+        assert client.get(missing).status_code == 404
@@ -0,0 +1,183 @@
+"""
+Tests for realtime updates over WebSockets.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+{%- if cookiecutter.include_accounts_app == "yes" %}
+from channels.db import database_sync_to_async
+{%- endif %}
+from channels.testing import WebsocketCommunicator
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import Client
+{%- if cookiecutter.use_rest_framework == "yes" %}
+from rest_framework_simplejwt.tokens import AccessToken
+{%- endif %}
+
+from config.asgi import application
+from config.realtime import LocalChannelLayer
+
+User = get_user_model()
+
+# Consumers reach the database from other threads.
+realtime_db = pytest.mark.django_db(transaction=True)
+
+
+def session_cookie(user) -> str:
+    client = Client()
+    client.force_login(user)
+    name = settings.SESSION_COOKIE_NAME
+    return f"{name}={client.cookies[name].value}"
+
+
+def communicator(cookie: str = "", origin: str = "http://localhost"):
+    headers = [(b"origin", origin.encode())]
+    if cookie:
+        headers.append((b"cookie", cookie.encode()))
+    return WebsocketCommunicator(application, "/ws/updates/", headers=headers)
+
+
+def run(scenario) -> None:
+    async_to_sync(scenario)()
+
+
+class TestLocalChannelLayer:
+    """Tests for LocalChannelLayer."""
+
+    def test_group_send_skips_full_channels(self):
+        """Test every member gets the message, even when one is full."""
+        layer = LocalChannelLayer(capacity=1)
+
+        async def scenario():
+            channels = [await layer.new_channel() for _ in range(3)]
+            for channel in channels:
+                await layer.group_add("group", channel)
+            await layer.send(channels[0], {"type": "old"})
+
+            await layer.group_send("group", {"type": "new"})
+
+            assert [(await layer.receive(c))["type"] for c in channels] == [
+                "old",
+                "new",
+                "new",
+            ]
+
+        run(scenario)
+
+    def test_expired_entries_are_still_swept(self, monkeypatch):
+        """Test expired messages drop their channel from groups once swept."""
+        layer = LocalChannelLayer(expiry=0)
+        monkeypatch.setattr(layer, "sweep_interval", 0)
+
+        async def scenario():
+            channel = await layer.new_channel()
+            await layer.group_add("group", channel)
+            await layer.send(channel, {"type": "stale"})
+
+            await layer.group_send("group", {"type": "new"})
+
+            assert not layer.groups.get("group")
+
+        run(scenario)
+
+
+@realtime_db
+class TestUpdatesConsumer:
+    """Tests for connecting to and subscribing on /ws/updates/."""
+
+    def test_rejects_anonymous_and_foreign_origins(self, create_user):
+        """Test sockets need a user and an allowed Origin."""
+        cookie = session_cookie(create_user("alice"))
+
+        async def scenario():
+            connected, _ = await communicator().connect()
+            assert not connected
+
+            socket = communicator(cookie, origin="https://evil.example.com")
+            connected, _ = await socket.connect()
+            assert not connected
+
+        run(scenario)
+
+{%- if cookiecutter.include_accounts_app == "yes" %}
+
+    def test_session_user_gets_own_changes(self, create_user):
+        """Test a user is notified of changes to their own account only."""
+        alice, bob = create_user("alice"), create_user("bob")
+        cookie = session_cookie(alice)
+
+        async def scenario():
+            socket = communicator(cookie)
+            connected, _ = await socket.connect()
+            assert connected
+
+            await database_sync_to_async(bob.save)()
+            await database_sync_to_async(alice.save)()
+
+            assert await socket.receive_json_from() == {
+                "type": "user.updated",
+                "id": alice.pk,
+            }
+            assert await socket.receive_nothing()
+            await socket.disconnect()
+
+        run(scenario)
+{%- endif %}
+{%- if cookiecutter.use_rest_framework == "yes" %}
+
+    def test_jwt_cookie(self, create_user):
+        """Test dj-rest-auth's access cookie authenticates the socket."""
+        alice = create_user("alice")
+        name = settings.REST_AUTH["JWT_AUTH_COOKIE"]
+
+        async def scenario():
+            socket = communicator(f"{name}={AccessToken.for_user(alice)}")
+            connected, _ = await socket.connect()
+            assert connected
+            await socket.disconnect()
+
+            connected, _ = await communicator(f"{name}=not-a-token").connect()
+            assert not connected
+
+        run(scenario)
+{%- endif %}
+{%- if cookiecutter.include_accounts_app == "yes" %}
+
+    def test_users_topic_is_staff_only(self, create_user):
+        """Test only staff can follow changes to every user."""
+        staff = create_user("staff", is_staff=True)
+        alice = create_user("alice")
+        staff_cookie, alice_cookie = session_cookie(staff), session_cookie(alice)
+
+        async def scenario():
+            staff_socket = communicator(staff_cookie)
+            alice_socket = communicator(alice_cookie)
+            await staff_socket.connect()
+            await alice_socket.connect()
+
+            subscribe = {"action": "subscribe", "topic": "users"}
+            await staff_socket.send_json_to(subscribe)
+            await alice_socket.send_json_to(subscribe)
+            assert (await staff_socket.receive_json_from())["type"] == "subscribed"
+            assert (await alice_socket.receive_json_from())["type"] == "error"
+
+            bob = await database_sync_to_async(create_user)("bob")
+            bob_id = bob.pk
+            await database_sync_to_async(bob.delete)()
+
+            assert await staff_socket.receive_json_from() == {
+                "type": "user.created",
+                "id": bob_id,
+            }
+            assert await staff_socket.receive_json_from() == {
+                "type": "user.deleted",
+                "id": bob_id,
+            }
+            assert await alice_socket.receive_nothing()
+
+            await staff_socket.disconnect()
+            await alice_socket.disconnect()
+
+        run(scenario)
+{%- endif %}
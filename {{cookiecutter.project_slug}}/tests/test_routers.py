@@ -0,0 +1,155 @@
+"""
+Tests for read-replica routing.
+
+The ``replica`` test database is a separate, empty SQLite database: rows
+written to ``default`` are not replicated to it, which makes it easy to see
+where a read went.
+"""
+
+import pytest
+from django.contrib.auth.models import Group
+from django.db import DatabaseError, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from config.routers import (
+    PIN_COOKIE,
+    ReplicaRouter,
+    replica_pinning_middleware,
+    use_primary,
+)
+
+replica_db = pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+
+
+@pytest.fixture
+def router():
+    router = ReplicaRouter(replicas=["replica"], max_lag=5, check_interval=60)
+    with override_settings(DATABASE_ROUTERS=[router]):
+        yield router
+
+
+def group_exists(name: str) -> bool:
+    return Group.objects.filter(name=name).exists()
+
+
+class TestReplicaRouter:
+    """Tests for ReplicaRouter's choice of database."""
+
+    def test_round_robin(self, monkeypatch):
+        """Test reads rotate over the replicas and writes go to default."""
+        router = ReplicaRouter(replicas=["a", "b"], check_interval=60)
+        monkeypatch.setattr(router, "check", lambda alias: True)
+
+        assert [router.db_for_read(Group) for _ in range(3)] == ["a", "b", "a"]
+        assert router.db_for_write(Group) == "default"
+
+    def test_unhealthy_replicas_are_skipped(self, monkeypatch):
+        """Test failing replicas leave the rotation, falling back to default."""
+        router = ReplicaRouter(replicas=["a", "b"], check_interval=60)
+        healthy = {"a": False, "b": True}
+        monkeypatch.setattr(router, "check", lambda alias: healthy[alias])
+
+        assert {router.db_for_read(Group) for _ in range(4)} == {"b"}
+
+        router = ReplicaRouter(replicas=["a"], check_interval=60)
+        monkeypatch.setattr(router, "check", lambda alias: False)
+        assert router.db_for_read(Group) == "default"
+
+    def test_health_is_rechecked_after_interval(self, monkeypatch):
+        """Test a replica rejoins the rotation once a later check passes."""
+        router = ReplicaRouter(replicas=["a"], check_interval=60)
+        results = iter([False, True])
+        monkeypatch.setattr(router, "check", lambda alias: next(results))
+        clock = iter([1000.0, 1030.0, 1061.0])
+        monkeypatch.setattr("config.routers.time.monotonic", lambda: next(clock))
+
+        assert router.db_for_read(Group) == "default"
+        assert router.db_for_read(Group) == "default"
+        assert router.db_for_read(Group) == "a"
+
+    @pytest.mark.parametrize(
+        ("lag", "healthy"), [(0.0, True), (5.0, True), (5.1, False)]
+    )
+    def test_lagging_replicas_fail_check(self, monkeypatch, lag, healthy):
+        """Test replicas lagging more than max_lag fail their check."""
+        router = ReplicaRouter(replicas=["a"], max_lag=5)
+        monkeypatch.setattr(router, "replica_lag", lambda alias: lag)
+        assert router.check("a") is healthy
+
+    def test_unreachable_replicas_fail_check(self, monkeypatch):
+        """Test database errors while checking mark the replica unhealthy."""
+        router = ReplicaRouter(replicas=["a"])
+
+        def fail(alias):
+            raise DatabaseError("connection refused")
+
+        monkeypatch.setattr(router, "replica_lag", fail)
+        assert router.check("a") is False
+
+    def test_replicas_are_not_migrated(self):
+        """Test migrations only run on default."""
+        router = ReplicaRouter(replicas=["replica"])
+        assert router.allow_migrate("default", "accounts")
+        assert not router.allow_migrate("replica", "accounts")
+
+
+@replica_db
+class TestRouting:
+    """Tests routing against the stand-in replica database."""
+
+    def test_reads_use_replica(self, router):
+        """Test reads go to the replica, which has not seen the write."""
+        Group.objects.create(name="editors")
+
+        assert router.check("replica")
+        assert not group_exists("editors")
+
+    def test_use_primary(self, router):
+        """Test use_primary() reads from default."""
+        Group.objects.create(name="editors")
+
+        with use_primary():
+            assert group_exists("editors")
+
+    def test_transactions_read_primary(self, router):
+        """Test reads inside transaction.atomic() use default."""
+        with transaction.atomic():
+            Group.objects.create(name="editors")
+            assert group_exists("editors")
+
+
+@replica_db
+class TestReplicaPinningMiddleware:
+    """Tests for read-your-writes through replica_pinning_middleware."""
+
+    @override_settings(DATABASE_REPLICA_MAX_LAG=5)
+    def test_request_reads_its_writes(self, router):
+        """Test a request reads from default after it writes."""
+        seen = []
+
+        def view(request):
+            seen.append(group_exists("editors"))
+            Group.objects.create(name="editors")
+            seen.append(group_exists("editors"))
+            return HttpResponse()
+
+        response = replica_pinning_middleware(view)(RequestFactory().post("/"))
+
+        assert seen == [False, True]
+        assert response.cookies[PIN_COOKIE]["max-age"] == 5
+        assert not group_exists("editors")
+
+    def test_pinned_client_reads_primary(self, router):
+        """Test requests carrying the pin cookie read from default."""
+        Group.objects.create(name="editors")
+        request = RequestFactory().get("/")
+        request.COOKIES[PIN_COOKIE] = "1"
+
+        def view(request):
+            return HttpResponse(str(group_exists("editors")))
+
+        response = replica_pinning_middleware(view)(request)
+
+        assert response.content == b"True"
+        assert PIN_COOKIE not in response.cookies
@@ -0,0 +1,179 @@
+"""
+Tests for the fast read path of FastReadModelSerializer.
+"""
+
+import gc
+import weakref
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from accounts.serializers import UserDetailsSerializer
+from config.serializers import FastReadModelSerializer, ValuesListSerializer
+
+User = get_user_model()
+
+
+class PlainUserSerializer(serializers.ModelSerializer):
+    """Reference serializer using DRF's regular read path."""
+
+    class Meta:
+        model = User
+        fields = ("id", "email", "is_staff", "date_joined", "last_login")
+
+
+class FastUserSerializer(FastReadModelSerializer):
+    class Meta:
+        model = User
+        fields = PlainUserSerializer.Meta.fields
+
+
+class RenamedFieldSerializer(FastReadModelSerializer):
+    """Declared fields that still need conversion."""
+
+    user_id = serializers.CharField(source="id")
+
+    class Meta:
+        model = User
+        fields = ("user_id", "email")
+
+
+class PropertySerializer(FastReadModelSerializer):
+    """Serializer with a non-column field, which disables the fast path."""
+
+    display_name = serializers.ReadOnlyField()
+
+    class Meta:
+        model = User
+        fields = ("id", "display_name")
+
+
+class PrefixedEmailField(serializers.EmailField):
+    """Field whose conversion depends on the serializer context."""
+
+    def to_representation(self, value):
+        return f"{self.context['prefix']}:{value}"
+
+
+class ContextSerializer(FastReadModelSerializer):
+    email = PrefixedEmailField()
+
+    class Meta:
+        model = User
+        fields = ("id", "email")
+
+
+@pytest.mark.django_db
+class TestFastReadModelSerializer:
+    """Tests for FastReadModelSerializer."""
+
+    def test_list_matches_plain_serializer(self, users):
+        """Test queryset output equals DRF's regular ModelSerializer output."""
+        expected = PlainUserSerializer(users, many=True).data
+        assert FastUserSerializer(users, many=True).data == expected
+
+    def test_list_does_not_instantiate_models(self, users, monkeypatch):
+        """Test querysets are rendered from values_list rows."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("model instantiated")
+
+        serializer = FastUserSerializer(users, many=True)
+        assert isinstance(serializer, ValuesListSerializer)
+        monkeypatch.setattr(User, "from_db", classmethod(fail))
+        assert len(serializer.data) == 3
+
+    def test_instance_matches_plain_serializer(self, users):
+        """Test single instances render like DRF."""
+        user = users.first()
+        assert FastUserSerializer(user).data == PlainUserSerializer(user).data
+
+    def test_rows_and_instances_lists(self, users):
+        """Test lists of values_list rows or of instances are both accepted."""
+        expected = PlainUserSerializer(users, many=True).data
+        rows = list(FastUserSerializer().values_list(users))
+        assert FastUserSerializer(rows, many=True).data == expected
+        assert FastUserSerializer(list(users), many=True).data == expected
+
+    def test_converted_fields(self, users):
+        """Test non-default field classes still go through to_representation."""
+        data = RenamedFieldSerializer(users, many=True).data
+        assert data[0] == {"user_id": str(users[0].id), "email": "a@example.com"}
+
+    def test_converters_use_each_serializers_context(self, users):
+        """Test conversions see the context of the serializer running them."""
+        for prefix in ("first", "second"):
+            context = {"prefix": prefix}
+            rows = ContextSerializer(users, many=True, context=context).data
+            single = ContextSerializer(users.first(), context=context).data
+            assert rows[0]["email"] == f"{prefix}:a@example.com"
+            assert single["email"] == f"{prefix}:a@example.com"
+
+    def test_plan_keeps_no_serializer_alive(self, users):
+        """Test the plan cached on the class holds no serializer or context."""
+        serializer = ContextSerializer(users.first(), context={"prefix": "p"})
+        assert serializer.data["email"] == "p:a@example.com"
+
+        ref = weakref.ref(serializer)
+        del serializer
+        gc.collect()
+        assert ref() is None
+
+    def test_unsupported_fields_fall_back(self, users):
+        """Test serializers with non-column fields use DRF's read path."""
+        assert PropertySerializer().read_plan is None
+        data = PropertySerializer(users, many=True).data
+        assert data[0]["display_name"] == "A"
+
+    def test_related_fields_fall_back(self, users):
+        """Test many-to-many fields disable the fast path."""
+
+        class GroupsSerializer(FastReadModelSerializer):
+            class Meta:
+                model = User
+                fields = ("id", "groups")
+
+        group = Group.objects.create(name="staff")
+        users.first().groups.add(group)
+        assert GroupsSerializer().read_plan is None
+        assert GroupsSerializer(users, many=True).data[0]["groups"] == [group.pk]
+
+    def test_writes_use_full_serializer(self, users):
+        """Test validation and updates are unchanged."""
+        user = users.first()
+        serializer = UserDetailsSerializer(
+            user, data={"first_name": "New"}, partial=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+        user.refresh_from_db()
+        assert user.first_name == "New"
+        assert serializer.data["first_name"] == "New"
+
+
+@pytest.mark.django_db
+class TestUserListView:
+    """Tests for the staff-only user list endpoint."""
+
+    def test_paginated_list(self, users):
+        """Test the endpoint returns serialized users page by page."""
+        client = APIClient()
+        client.force_authenticate(users.get(email="admin@example.com"))
+
+        response = client.get("/api/users/")
+
+        all_users = User.objects.order_by("id")
+        assert response.status_code == 200
+        assert response.data["count"] == all_users.count()
+        assert response.data["results"] == (
+            UserDetailsSerializer(all_users, many=True).data
+        )
+
+    def test_requires_staff(self, users):
+        """Test non-staff users are rejected."""
+        client = APIClient()
+        client.force_authenticate(users.get(email="a@example.com"))
+        assert client.get("/api/users/").status_code == 403
@@ -0,0 +1,187 @@
+"""
+Tests for the token-bucket throttles.
+"""
+
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework.views import APIView
+
+from config.throttling import (
+    AnonRateThrottle,
+    LoginAccountRateThrottle,
+    TokenBucketThrottle,
+    UserRateThrottle,
+)
+
+User = get_user_model()
+
+
+class Clock:
+    """Settable replacement for the throttles' ``timer``."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(TokenBucketThrottle, "timer", clock)
+    return clock
+
+
+@pytest.fixture
+def rates(monkeypatch):
+    def set_rate(scope: str, rate: str) -> None:
+        monkeypatch.setitem(SimpleRateThrottle.THROTTLE_RATES, scope, rate)
+
+    return set_rate
+
+
+def request_from(ip: str = "10.0.0.1", user=None):
+    request = APIRequestFactory().get("/", REMOTE_ADDR=ip)
+    if user is not None:
+        force_authenticate(request, user)
+    return APIView().initialize_request(request)
+
+
+def allowed(throttle_class, request, count: int) -> list[bool]:
+    return [throttle_class().allow_request(request, None) for _ in range(count)]
+
+
+class TestTokenBucketThrottle:
+    """Tests for TokenBucketThrottle."""
+
+    def test_burst_then_refill(self, clock, rates):
+        """Test num_requests pass at once, then one per interval."""
+        rates("anon", "3/min")
+        request = request_from()
+
+        assert allowed(AnonRateThrottle, request, 4) == [True, True, True, False]
+
+        throttle = AnonRateThrottle()
+        assert not throttle.allow_request(request, None)
+        assert throttle.wait() == pytest.approx(20)
+
+        clock.now += throttle.wait()
+        assert allowed(AnonRateThrottle, request, 2) == [True, False]
+
+    def test_buckets_are_per_client(self, clock, rates):
+        """Test each IP has its own bucket."""
+        rates("anon", "1/min")
+
+        assert allowed(AnonRateThrottle, request_from("10.0.0.1"), 2) == [True, False]
+        assert allowed(AnonRateThrottle, request_from("10.0.0.2"), 1) == [True]
+
+    def test_no_second_burst(self, clock, rates):
+        """Test a burst is followed only by the refill rate, not another burst."""
+        rates("anon", "3/min")
+        request = request_from()
+        assert allowed(AnonRateThrottle, request, 3) == [True, True, True]
+
+        passed = 0
+        for _ in range(59):
+            clock.now += 1
+            passed += sum(allowed(AnonRateThrottle, request, 3))
+
+        assert passed == 2
+
+    def test_full_bucket_after_idle_period(self, clock, rates):
+        """Test an idle client gets its whole burst back, but no more."""
+        rates("anon", "3/min")
+        request = request_from()
+        assert allowed(AnonRateThrottle, request, 3) == [True, True, True]
+
+        clock.now += 3600
+        assert allowed(AnonRateThrottle, request, 4) == [True, True, True, False]
+
+    @pytest.mark.django_db
+    def test_users_are_counted_by_id(self, clock, rates):
+        """Test authenticated users are limited per user, not per IP."""
+        rates("user", "1/min")
+        user = User.objects.create_user(
+            **{User.USERNAME_FIELD: "a@example.com"}, password="pw"
+        )
+
+        assert allowed(UserRateThrottle, request_from("10.0.0.1", user), 1) == [True]
+        assert allowed(UserRateThrottle, request_from("10.0.0.2", user), 1) == [False]
+        assert allowed(UserRateThrottle, request_from("10.0.0.2"), 1) == [True]
+
+    def test_concurrent_requests_count_once_each(self, clock, rates):
+        """Test the counter is atomic: no more than num_requests pass."""
+        rates("anon", "20/min")
+        request = request_from()
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.extend(allowed(AnonRateThrottle, request, 10))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 20
+
+
+@pytest.mark.django_db
+class TestLoginThrottles:
+    """Tests for the login endpoint's per-IP and per-account limits."""
+
+    def login(self, email: str, ip: str):
+        return APIClient().post(
+            "/api/auth/login/",
+            {"email": email, "password": "wrong"},
+            format="json",
+            REMOTE_ADDR=ip,
+        )
+
+    def test_per_ip(self, clock, rates):
+        """Test one IP is limited across accounts."""
+        rates("login", "2/min")
+
+        codes = [
+            self.login(f"user{i}@example.com", "10.0.0.1").status_code for i in range(3)
+        ]
+
+        assert codes == [400, 400, 429]
+        assert self.login("user9@example.com", "10.0.0.2").status_code == 400
+
+    def test_per_account(self, clock, rates):
+        """Test one account is limited across IPs, ignoring email case."""
+        rates("login_account", "2/min")
+
+        codes = [
+            self.login(email, f"10.0.0.{i}").status_code
+            for i, email in enumerate(
+                ["a@example.com", "A@Example.com", "a@example.com"]
+            )
+        ]
+
+        assert codes == [400, 400, 429]
+        assert self.login("b@example.com", "10.0.0.9").status_code == 400
+
+    def test_account_key_needs_an_identifier(self):
+        """Test requests without an email or username are not counted."""
+        request = APIView().initialize_request(
+            APIRequestFactory().post("/", {"password": "x"}, format="json")
+        )
+        assert LoginAccountRateThrottle().get_cache_key(request, None) is None
@@ -0,0 +1,16 @@
+"""
+Models that only exist in the test database.
+"""
+
+from django.db import models
+
+from config.media import ProtectedFileField
+
+
+class Document(models.Model):
+    """Owner of a protected file, for the protected media tests."""
+
+    file = ProtectedFileField(upload_to="docs/")
+
+    def __str__(self) -> str:
+        return self.file.name